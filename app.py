@@ -1,15 +1,96 @@
-from flask import Flask, jsonify, render_template
+from flask import Flask, Response, jsonify, render_template, request, stream_with_context
+from flask_orjson import OrjsonProvider
+import orjson
+from bisect import bisect_right
+import functools
+import hashlib
+import numpy as np
 import sqlite3
+import threading
+import time
 from datetime import datetime
-from orbital_calculations import OrbitalCalculator
+from orbital_calculations import BodyState, OrbitalCalculator, parse_ymd
+
+# Responses are recomputed at most once per this many seconds; polls within
+# the same bucket get the cached JSON bytes without touching the DB
+RESPONSE_CACHE_SECONDS = 10
+
+# How often the background ticker checks whether a new time bucket has started
+TICKER_INTERVAL_SECONDS = 0.5
+
+# Browser cache lifetime for /api/solar-system-static (revalidated with its ETag)
+STATIC_CACHE_MAX_AGE = 86400
+
+# Planet columns holding the orbital elements used for position calculations
+ORBITAL_ELEMENT_KEYS = ('semi_major_axis', 'eccentricity', 'inclination', 'orbital_period',
+                        'mean_anomaly_0', 'perihelion_0', 'ascending_node_0')
+
+# Queries select only the columns the API reads
+PLANETS_QUERY = '''
+    SELECT name, name_en, wikipedia_url, wikipedia_url_en, type, type_en,
+           semi_major_axis, eccentricity, inclination, orbital_period,
+           mean_anomaly_0, perihelion_0, ascending_node_0,
+           mass, rotation_period, density, radius, equatorial_radius, polar_radius,
+           magnetic_field, atmospheric_pressure
+    FROM planets ORDER BY semi_major_axis
+'''
+MOONS_QUERY = '''
+    SELECT id, name, name_en, wikipedia_url, wikipedia_url_en, type, type_en, parent_planet,
+           semi_major_axis, orbital_period, inclination,
+           mass, rotation_period, density, radius, surface_temperature,
+           atmosphere, atmosphere_en, magnetic_field, atmospheric_pressure
+    FROM moons ORDER BY parent_planet, semi_major_axis
+'''
+SPACECRAFT_QUERY = '''
+    SELECT id, name, name_en, wikipedia_url, wikipedia_url_en, launch_date, target_body,
+           status, trajectory_type, launch_speed, current_phase, arrival_time
+    FROM spacecraft ORDER BY status != 'active', launch_date
+'''
+
+# Spacecraft target bodies whose planet's position can be used for target distance
+# (targets missing here, such as the Sun or the Kuiper Belt, have no planet entry)
+TARGET_BODY_PLANETS = {
+    'Jupiter': 'Jupiter',
+    'Saturn': 'Saturn',
+    'Mars': 'Mars',
+    'Europa': 'Jupiter',  # Europa orbits Jupiter
+}
+
+# Target planets whose orbital speed is used for orbiting spacecraft
+ORBITER_TARGET_PLANETS = frozenset(('Jupiter', 'Saturn', 'Mars'))
+
+# Display formatters for API fields, bound once instead of re-parsing f-string specs per body
+_FMT_SPEED = '{:.2f} km/s'.format
+_FMT_MASS = '{:.4e} kg'.format
+_FMT_HOURS = '{:.2f} hours'.format
+_FMT_YEARS = '{:.4f} Earth years'.format
+_FMT_DAYS = '{:.4f} Earth days'.format
+_FMT_DENSITY = '{:.3f} g/cm³'.format
+_FMT_RADIUS = '{:.1f} km'.format
+_FMT_MICROTESLA = '{:.3f} µT'.format
+_FMT_NANOTESLA = '{:.1f} nT'.format
+_FMT_KELVIN = '{:.0f} K'.format
+
+class SolarSystemJSONProvider(OrjsonProvider):
+    """orjson-backed JSON provider (UTF-8 output, so Chinese names need no escaping)"""
+    option = OrjsonProvider.option | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
 
 app = Flask(__name__)
-app.config['JSON_AS_ASCII'] = False  # Support Chinese characters in JSON
+app.json = SolarSystemJSONProvider(app)
+
+# One long-lived read-only connection per thread (gunicorn workers are single-threaded,
+# the Flask dev server is not), instead of reopening the database on every request
+_db_local = threading.local()
 
 def get_db_connection():
-    """Create database connection"""
-    conn = sqlite3.connect('solar_system.db')
-    conn.row_factory = sqlite3.Row
+    """Return this thread's database connection, opening it on first use"""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect('solar_system.db', isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA query_only=ON')
+        conn.execute('PRAGMA cache_size=-20000')  # ~20 MB page cache
+        _db_local.conn = conn
     return conn
 
 @app.route('/')
@@ -22,264 +103,373 @@ def get_solar_system_data():
     """
     API endpoint to get real-time solar system data
     Returns planets, moons, and spacecraft with their current positions
+    Query parameters:
+    - include_earth_relative: '0' to skip distances and speeds relative to Earth
     """
-    current_time = datetime.now()
-    conn = get_db_connection()
+    include_earth_relative = request.args.get('include_earth_relative', '1') != '0'
+    bucket = int(time.time()) // RESPONSE_CACHE_SECONDS
+    cached_bucket, body = _cached_responses.get(('data', include_earth_relative), (None, None))
+    if cached_bucket == bucket:
+        return Response(body, mimetype='application/json')
+    return Response(stream_with_context(_stream_and_cache(bucket, include_earth_relative)),
+                    mimetype='application/json')
+
+# Serialized responses for the most recent time bucket, as (bucket, bytes), keyed by
+# ('data', include_earth_relative) for the full endpoint and 'dynamic' for positions only
+_cached_responses = {}
+
+def _stream_and_cache(bucket, include_earth_relative):
+    """Stream the response for a time bucket, caching the full body once it completes"""
+    current_time = datetime.fromtimestamp(bucket * RESPONSE_CACHE_SECONDS)
+    chunks = []
+    for chunk in iter_solar_system_json(current_time, include_earth_relative):
+        chunks.append(chunk)
+        yield chunk
+    _cached_responses[('data', include_earth_relative)] = (bucket, b''.join(chunks))
+
+def _refresh_responses(bucket):
+    """Compute and cache the default full response and the dynamic response for a time bucket"""
+    current_time = datetime.fromtimestamp(bucket * RESPONSE_CACHE_SECONDS)
+    body = b''.join(iter_solar_system_json(current_time))
+    _cached_responses[('data', True)] = (bucket, body)
+    body = orjson.dumps(build_dynamic_state(current_time), option=app.json.option)
+    _cached_responses['dynamic'] = (bucket, body)
+
+def _ticker():
+    """
+    Background loop that fills the response cache as soon as each time bucket starts,
+    so requests just return the cached bytes instead of computing positions themselves
+    """
+    last_bucket = None
+    while True:
+        bucket = int(time.time()) // RESPONSE_CACHE_SECONDS
+        if bucket != last_bucket:
+            # Marked as attempted up front, so a persistent failure is logged once per
+            # bucket rather than on every tick (requests compute their own response meanwhile)
+            last_bucket = bucket
+            try:
+                _refresh_responses(bucket)
+            except Exception:
+                app.logger.exception('Background refresh of solar system data failed')
+        time.sleep(TICKER_INTERVAL_SECONDS)
+
+@app.route('/api/solar-system-static')
+def get_solar_system_static():
+    """
+    API endpoint for the parts of the solar system data that do not change with time:
+    names, links, types, pre-formatted physical properties and spacecraft mission info.
+    Cacheable by the browser; pair with /api/solar-system-dynamic for positions.
+    """
+    bodies = load_static_bodies()
+    planets = [
+        dict(planet_static, moons=[moon_static for _, moon_static in bodies['moons_by_parent'].get(planet_static['id'], ())])
+        for planet_static in bodies['planets']
+    ]
+    spacecraft = [spacecraft_static_info(sc) for sc in get_db_connection().execute(SPACECRAFT_QUERY)]
+    body = orjson.dumps({'planets': planets, 'spacecraft': spacecraft}, option=app.json.option)
     
-    # Get all planets
-    planets = conn.execute('SELECT * FROM planets ORDER BY semi_major_axis').fetchall()
+    response = Response(body, mimetype='application/json')
+    response.set_etag(hashlib.sha1(body).hexdigest())
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_CACHE_MAX_AGE
+    return response.make_conditional(request)
+
+@app.route('/api/solar-system-dynamic')
+def get_solar_system_dynamic():
+    """
+    API endpoint for the time-varying part of the solar system data:
+    {timestamp, planets: {id: state}, moons: {id: state}, spacecraft: {id: state}}
+    where state is {x, y, z, vx, vy, vz, distance_sun_au, speed_sun} (AU and km/s)
+    """
+    bucket = int(time.time()) // RESPONSE_CACHE_SECONDS
+    cached_bucket, body = _cached_responses.get('dynamic', (None, None))
+    if cached_bucket != bucket:
+        current_time = datetime.fromtimestamp(bucket * RESPONSE_CACHE_SECONDS)
+        body = orjson.dumps(build_dynamic_state(current_time), option=app.json.option)
+        _cached_responses['dynamic'] = (bucket, body)
+    return Response(body, mimetype='application/json')
+
+def _dynamic_state(position):
+    """Raw position, velocity, distance and speed from a BodyState"""
+    return {
+        'x': position.x,
+        'y': position.y,
+        'z': position.z,
+        'vx': position.vx,
+        'vy': position.vy,
+        'vz': position.vz,
+        'distance_sun_au': position.distance_sun,
+        'speed_sun': position.speed_sun
+    }
+
+def build_dynamic_state(current_time):
+    """Positions of all planets, moons and spacecraft at current_time, keyed by id"""
+    bodies = load_static_bodies()
+    planets = {}
+    moons = {}
+    earth_position = None
     
-    result = {
+    for planet_static, position, moon_states in compute_planet_and_moon_states(bodies, current_time):
+        if planet_static['name_en'] == 'Earth':
+            earth_position = position
+        planets[planet_static['id']] = _dynamic_state(position)
+        for moon_static, moon_position in moon_states:
+            moons[moon_static['id']] = _dynamic_state(moon_position)
+    
+    planet_names = {planet_static['name_en'] for planet_static in bodies['planets']}
+    spacecraft_rows = get_db_connection().execute(SPACECRAFT_QUERY).fetchall()
+    spacecraft_positions = compute_spacecraft_positions(spacecraft_rows, planet_names, earth_position, current_time)
+    spacecraft = {
+        sc['id']: _dynamic_state(position)
+        for sc, position in zip(spacecraft_rows, spacecraft_positions)
+    }
+    
+    return {
         'timestamp': current_time.isoformat(),
-        'planets': []
+        'planets': planets,
+        'moons': moons,
+        'spacecraft': spacecraft
     }
+
+@functools.lru_cache(maxsize=None)
+def load_static_bodies():
+    """
+    Load planet and moon reference data once per process.
+    Names, links, physical properties and orbital elements never change at runtime,
+    so the display strings are formatted here rather than on every request.
+    Returns a dict with:
+    - planets: per-planet static fields (including pre-formatted extra_info)
+    - planet_orbits: prepared orbital elements for calculate_planet_positions_prepared
+    - moons_by_parent: planet id -> list of (moon orbital elements, moon static fields)
+    """
+    conn = get_db_connection()
+    planets = conn.execute(PLANETS_QUERY).fetchall()
     
-    # Store Earth position for relative calculations
-    earth_position = None
+    planet_elements = {
+        key: np.fromiter((planet[key] for planet in planets), dtype=float, count=len(planets))
+        for key in ORBITAL_ELEMENT_KEYS
+    }
     
-    # Calculate planet positions
-    for planet in planets:
-        planet_data = dict(planet)
-        
-        # Calculate orbital position
-        orbital_elements = {
-            'semi_major_axis': planet['semi_major_axis'],
-            'eccentricity': planet['eccentricity'],
-            'inclination': planet['inclination'],
-            'orbital_period': planet['orbital_period'],
-            'mean_anomaly_0': planet['mean_anomaly_0'],
-            'perihelion_0': planet['perihelion_0'],
-            'ascending_node_0': planet['ascending_node_0']
+    planets_static = [{
+        'id': planet['name_en'],  # Planets are keyed by English name
+        'name': planet['name'],
+        'name_en': planet['name_en'],
+        'wikipedia_url': planet['wikipedia_url'],
+        'wikipedia_url_en': planet['wikipedia_url_en'],
+        'type': 'planet',
+        'planet_type': planet['type'],  # Planet type in Chinese
+        'planet_type_en': planet['type_en'],  # Planet type in English
+        'extra_info': {
+            'mass': _FMT_MASS(planet['mass']),
+            'rotation_period': _FMT_HOURS(planet['rotation_period']),
+            'orbital_period': _FMT_YEARS(planet['orbital_period']),
+            'density': _FMT_DENSITY(planet['density']),
+            'radius': _FMT_RADIUS(planet['radius']),
+            'equatorial_radius': _FMT_RADIUS(planet['equatorial_radius']),
+            'polar_radius': _FMT_RADIUS(planet['polar_radius']),
+            'magnetic_field': _FMT_MICROTESLA(planet['magnetic_field']) if planet['magnetic_field'] is not None else '无',
+            'atmospheric_pressure': format_atmospheric_pressure(planet['atmospheric_pressure'])
+        }
+    } for planet in planets]
+    
+    moons_by_parent = {}
+    for moon in conn.execute(MOONS_QUERY):
+        moon_elements = {
+            'semi_major_axis': moon['semi_major_axis'],
+            'orbital_period': moon['orbital_period'],
+            'inclination': moon['inclination']
+        }
+        moon_static = {
+            'id': moon['id'],
+            'name': moon['name'],
+            'name_en': moon['name_en'],
+            'wikipedia_url': moon['wikipedia_url'],
+            'wikipedia_url_en': moon['wikipedia_url_en'],
+            'type': 'moon',
+            'moon_type': moon['type'],  # Moon type in Chinese
+            'moon_type_en': moon['type_en'],  # Moon type in English
+            'extra_info': {
+                'mass': _FMT_MASS(moon['mass']),
+                'rotation_period': _FMT_HOURS(moon['rotation_period']),
+                'orbital_period': _FMT_DAYS(moon['orbital_period']),
+                'density': _FMT_DENSITY(moon['density']),
+                'radius': _FMT_RADIUS(moon['radius']),
+                'surface_temperature': _FMT_KELVIN(moon['surface_temperature']) if moon['surface_temperature'] else 'N/A',
+                'atmosphere': moon['atmosphere'] if moon['atmosphere'] else 'N/A',
+                'atmosphere_en': moon['atmosphere_en'] if moon['atmosphere_en'] else 'N/A',
+                'magnetic_field': _FMT_NANOTESLA(moon['magnetic_field']) if moon['magnetic_field'] is not None else '无',
+                'atmospheric_pressure': format_atmospheric_pressure(moon['atmospheric_pressure'])
+            }
         }
+        moons_by_parent.setdefault(moon['parent_planet'], []).append((moon_elements, moon_static))
+    
+    return {
+        'planets': planets_static,
+        'planet_orbits': OrbitalCalculator.prepare(planet_elements),
+        'moons_by_parent': moons_by_parent
+    }
+
+def compute_planet_and_moon_states(bodies, current_time):
+    """
+    Compute planet and moon positions at current_time for the bodies from load_static_bodies()
+    Yields (planet static fields, planet position, [(moon static fields, moon position), ...])
+    for each planet in order of distance from the Sun
+    """
+    # Calculate all planet positions in one vectorized pass
+    positions = OrbitalCalculator.calculate_planet_positions_prepared(bodies['planet_orbits'], current_time)
+    
+    for planet_static, position in zip(bodies['planets'], map(BodyState._make, positions.tolist())):
+        # Calculate moon positions from the parent planet's position and velocity
+        moons = [
+            (moon_static, OrbitalCalculator.calculate_moon_position(moon_elements, position, current_time))
+            for moon_elements, moon_static in bodies['moons_by_parent'].get(planet_static['id'], ())
+        ]
         
-        position = OrbitalCalculator.calculate_planet_position(orbital_elements, current_time)
+        yield planet_static, position, moons
+
+def spacecraft_static_info(sc):
+    """Non-positional fields of a spacecraft row, as returned by the API"""
+    return {
+        'id': sc['id'],
+        'name': sc['name'],
+        'name_en': sc['name_en'],
+        'wikipedia_url': sc['wikipedia_url'],
+        'wikipedia_url_en': sc['wikipedia_url_en'],
+        'type': 'spacecraft',
+        'launch_date': sc['launch_date'],
+        'target_body': sc['target_body'],
+        'status': sc['status'],
+        'trajectory_type': sc['trajectory_type'],
+        'current_phase': sc['current_phase'],
+        'arrival_time': sc['arrival_time']
+    }
+
+def compute_spacecraft_positions(spacecraft, planet_names, earth_position, current_time):
+    """
+    Calculate the positions of all spacecraft rows in one batch
+    planet_names are the English names of known planets
+    Returns one BodyState per spacecraft
+    """
+    # Orbiters of a known planet use its orbital speed
+    target_speeds = {name: 30.0 for name in ORBITER_TARGET_PLANETS if name in planet_names}  # Approximate
+    
+    positions = OrbitalCalculator.calculate_spacecraft_positions_batch(
+        spacecraft, current_time, target_speeds, earth_position
+    )
+    return [BodyState._make(row) for row in positions.tolist()]
+
+def iter_solar_system_json(current_time, include_earth_relative=True):
+    """
+    Compute planets, moons, and spacecraft with their positions at current_time,
+    yielding the JSON response in chunks so planets can be sent while spacecraft
+    are still being computed
+    When include_earth_relative is False, distances and speeds relative to Earth
+    are skipped (planets keep 'N/A', moons and spacecraft omit them)
+    """
+    dumps = functools.partial(orjson.dumps, option=app.json.option)
+    bodies = load_static_bodies()
+    planets = []
+    
+    # Store Earth position for relative calculations
+    earth_position = None
+    
+    # Planets and moons in output order, with their positions (AU) and velocities (km/s)
+    # packed as rows for the Earth-relative pass
+    relative_bodies = []
+    body_xyz = []
+    body_vxyz = []
+    
+    # Planet positions by English name for spacecraft target distances
+    planet_positions = {}
+    
+    for planet_static, position, moon_states in compute_planet_and_moon_states(bodies, current_time):
+        planet_positions[planet_static['name_en']] = position
         
         # Store Earth position
-        if planet['name_en'] == 'Earth':
+        if planet_static['name_en'] == 'Earth':
             earth_position = position
         
-        planet_info = {
-            'id': planet['id'],
-            'name': planet['name'],
-            'name_en': planet['name_en'],
-            'wikipedia_url': planet['wikipedia_url'],
-            'wikipedia_url_en': planet['wikipedia_url_en'],
-            'type': 'planet',
-            'planet_type': planet['type'],  # Planet type in Chinese
-            'planet_type_en': planet['type_en'],  # Planet type in English
-            'position': {
-                'x': position['x'],
-                'y': position['y'],
-                'z': position['z']
+        planet_info = dict(
+            planet_static,
+            position={
+                'x': position.x,
+                'y': position.y,
+                'z': position.z
             },
-            'distance_sun': OrbitalCalculator.format_distance(position['distance_sun']),
-            'distance_sun_au': position['distance_sun'],
-            'speed_sun': f"{position['speed_sun']:.2f} km/s",
-            'distance_earth': 'N/A',
-            'speed_earth': 'N/A',
-            'moons': [],
-            'extra_info': {
-                'mass': f"{planet['mass']:.4e} kg",
-                'rotation_period': f"{planet['rotation_period']:.2f} hours",
-                'orbital_period': f"{planet['orbital_period']:.4f} Earth years",
-                'density': f"{planet['density']:.3f} g/cm³",
-                'radius': f"{planet['radius']:.1f} km",
-                'equatorial_radius': f"{planet['equatorial_radius']:.1f} km",
-                'polar_radius': f"{planet['polar_radius']:.1f} km",
-                'magnetic_field': f"{planet['magnetic_field']:.3f} µT" if planet['magnetic_field'] is not None else '无',
-                'atmospheric_pressure': format_atmospheric_pressure(planet['atmospheric_pressure'])
-            }
-        }
+            distance_sun=OrbitalCalculator.format_distance(position.distance_sun),
+            distance_sun_au=position.distance_sun,
+            speed_sun=_FMT_SPEED(position.speed_sun),
+            distance_earth='N/A',
+            speed_earth='N/A',
+            moons=[]
+        )
+        relative_bodies.append(planet_info)
+        body_xyz.append(position[:3])
+        body_vxyz.append(position[3:6])
         
-        result['planets'].append(planet_info)
+        for moon_static, moon_position in moon_states:
+            moon_info = dict(
+                moon_static,
+                position={
+                    'x': moon_position.x,
+                    'y': moon_position.y,
+                    'z': moon_position.z
+                },
+                distance_sun=OrbitalCalculator.format_distance(moon_position.distance_sun),
+                distance_sun_au=moon_position.distance_sun,
+                speed_sun=_FMT_SPEED(moon_position.speed_sun)
+            )
+            planet_info['moons'].append(moon_info)
+            relative_bodies.append(moon_info)
+            body_xyz.append(moon_position[:3])
+            body_vxyz.append((0, 0, 0))  # Simplified: moon velocity is not used relative to Earth
+        
+        planets.append(planet_info)
     
-    # Calculate moon positions
-    for i, planet in enumerate(result['planets']):
-        moons = conn.execute('SELECT * FROM moons WHERE parent_planet_id = ? ORDER BY semi_major_axis', 
-                            (planet['id'],)).fetchall()
+    # Calculate relative positions for planets and moons in one vectorized pass
+    if include_earth_relative and earth_position:
+        earth_xyz = np.array(earth_position[:3])
+        earth_vxyz = np.array(earth_position[3:6])
+        distances = OrbitalCalculator.distances_to_earth(body_xyz, earth_xyz)
+        speeds = OrbitalCalculator.distances_to_earth(body_vxyz, earth_vxyz)
         
-        for moon in moons:
-            moon_data = dict(moon)
-            
-            # Get parent planet position
-            parent_pos = {
-                'x': planet['position']['x'],
-                'y': planet['position']['y'],
-                'z': planet['position']['z'],
-                'vx': 0,  # Will be updated from planet
-                'vy': 0,
-                'vz': 0
-            }
-            
-            # Get planet velocity from calculation
-            planet_record = planets[i]
-            orbital_elements = {
-                'semi_major_axis': planet_record['semi_major_axis'],
-                'eccentricity': planet_record['eccentricity'],
-                'inclination': planet_record['inclination'],
-                'orbital_period': planet_record['orbital_period'],
-                'mean_anomaly_0': planet_record['mean_anomaly_0'],
-                'perihelion_0': planet_record['perihelion_0'],
-                'ascending_node_0': planet_record['ascending_node_0']
-            }
-            planet_position = OrbitalCalculator.calculate_planet_position(orbital_elements, current_time)
-            parent_pos['vx'] = planet_position['vx']
-            parent_pos['vy'] = planet_position['vy']
-            parent_pos['vz'] = planet_position['vz']
-            
-            # Calculate moon position
-            moon_data_calc = {
-                'semi_major_axis': moon['semi_major_axis'],
-                'orbital_period': moon['orbital_period'],
-                'inclination': moon['inclination']
-            }
-            
-            position = OrbitalCalculator.calculate_moon_position(moon_data_calc, parent_pos, current_time)
-            
-            moon_info = {
-                'id': moon['id'],
-                'name': moon['name'],
-                'name_en': moon['name_en'],
-                'wikipedia_url': moon['wikipedia_url'],
-                'wikipedia_url_en': moon['wikipedia_url_en'],
-                'type': 'moon',
-                'moon_type': moon['type'],  # Moon type in Chinese
-                'moon_type_en': moon['type_en'],  # Moon type in English
-                'position': {
-                    'x': position['x'],
-                    'y': position['y'],
-                    'z': position['z']
-                },
-                'distance_sun': OrbitalCalculator.format_distance(position['distance_sun']),
-                'distance_sun_au': position['distance_sun'],
-                'speed_sun': f"{position['speed_sun']:.2f} km/s",
-                'extra_info': {
-                    'mass': f"{moon['mass']:.4e} kg",
-                    'rotation_period': f"{moon['rotation_period']:.2f} hours",
-                    'orbital_period': f"{moon['orbital_period']:.4f} Earth days",
-                    'density': f"{moon['density']:.3f} g/cm³",
-                    'radius': f"{moon['radius']:.1f} km",
-                    'surface_temperature': f"{moon['surface_temperature']:.0f} K" if moon['surface_temperature'] else 'N/A',
-                    'atmosphere': moon['atmosphere'] if moon['atmosphere'] else 'N/A',
-                    'atmosphere_en': moon['atmosphere_en'] if moon['atmosphere_en'] else 'N/A',
-                    'magnetic_field': f"{moon['magnetic_field']:.1f} nT" if moon['magnetic_field'] is not None else '无',
-                    'atmospheric_pressure': format_atmospheric_pressure(moon['atmospheric_pressure'])
-                }
-            }
-            
-            planet['moons'].append(moon_info)
+        for body, distance, speed in zip(relative_bodies, distances.tolist(), speeds.tolist()):
+            body['distance_earth'] = OrbitalCalculator.format_distance(distance)
+            body['speed_earth'] = _FMT_SPEED(speed)
     
-    # Calculate relative positions for planets and moons
-    if earth_position:
-        for planet in result['planets']:
-            planet_pos = {
-                'x': planet['position']['x'],
-                'y': planet['position']['y'],
-                'z': planet['position']['z'],
-                'vx': planet.get('vx', 0),
-                'vy': planet.get('vy', 0),
-                'vz': planet.get('vz', 0)
-            }
-            
-            # Get actual velocity from calculation
-            planet_record = next(p for p in planets if p['id'] == planet['id'])
-            orbital_elements = {
-                'semi_major_axis': planet_record['semi_major_axis'],
-                'eccentricity': planet_record['eccentricity'],
-                'inclination': planet_record['inclination'],
-                'orbital_period': planet_record['orbital_period'],
-                'mean_anomaly_0': planet_record['mean_anomaly_0'],
-                'perihelion_0': planet_record['perihelion_0'],
-                'ascending_node_0': planet_record['ascending_node_0']
-            }
-            planet_position = OrbitalCalculator.calculate_planet_position(orbital_elements, current_time)
-            planet_pos['vx'] = planet_position['vx']
-            planet_pos['vy'] = planet_position['vy']
-            planet_pos['vz'] = planet_position['vz']
-            
-            relative = OrbitalCalculator.calculate_relative_to_earth(planet_pos, earth_position)
-            planet['distance_earth'] = OrbitalCalculator.format_distance(relative['distance_earth'])
-            planet['speed_earth'] = f"{relative['speed_earth']:.2f} km/s"
-            
-            # Calculate relative positions for moons
-            for moon in planet['moons']:
-                moon_pos = {
-                    'x': moon['position']['x'],
-                    'y': moon['position']['y'],
-                    'z': moon['position']['z'],
-                    'vx': 0,  # Simplified
-                    'vy': 0,
-                    'vz': 0
-                }
-                relative = OrbitalCalculator.calculate_relative_to_earth(moon_pos, earth_position)
-                moon['distance_earth'] = OrbitalCalculator.format_distance(relative['distance_earth'])
-                moon['speed_earth'] = f"{relative['speed_earth']:.2f} km/s"
+    yield b'{"timestamp":' + dumps(current_time.isoformat()) + b',"planets":['
+    for index, planet_info in enumerate(planets):
+        yield (b',' if index else b'') + dumps(planet_info)
+    yield b'],"spacecraft":['
     
-    # Get spacecraft
-    spacecraft = conn.execute('SELECT * FROM spacecraft ORDER BY launch_date').fetchall()
-    result['spacecraft'] = []
+    # Get spacecraft (status and mission phase can change at runtime, so always re-read);
+    # the query returns active spacecraft first, then inactive, each in launch_date order
+    spacecraft = get_db_connection().execute(SPACECRAFT_QUERY).fetchall()
+    inactive_count = 0
     
-    # Separate active and inactive spacecraft
-    active_spacecraft = []
-    inactive_spacecraft = []
+    # Calculate all spacecraft positions in one vectorized pass
+    positions = compute_spacecraft_positions(spacecraft, planet_positions, earth_position, current_time)
     
-    for sc in spacecraft:
-        sc_data = dict(sc)
-        
-        # Calculate spacecraft position
-        spacecraft_info = {
-            'id': sc['id'],
-            'name': sc['name'],
-            'name_en': sc['name_en'],
-            'wikipedia_url': sc['wikipedia_url'],
-            'wikipedia_url_en': sc['wikipedia_url_en'],
-            'type': 'spacecraft',
-            'launch_date': sc['launch_date'],
-            'time_since_launch': OrbitalCalculator.format_time_since_launch(sc['launch_date']),
-            'target_body': sc['target_body'],
-            'status': sc['status'],
-            'trajectory_type': sc['trajectory_type'],
-            'current_phase': sc['current_phase'],
-            'arrival_time': sc['arrival_time']
-        }
-        
-        # Get target position if available
-        target_position = None
-        if sc['target_body'] in ['Jupiter', 'Saturn', 'Mars']:
-            target_planet = next((p for p in result['planets'] if p['name_en'] == sc['target_body']), None)
-            if target_planet:
-                target_position = {
-                    'speed_sun': 30.0  # Approximate
-                }
-        
-        position = OrbitalCalculator.calculate_spacecraft_position(
-            sc_data, target_position, earth_position
-        )
+    for index, (sc, position) in enumerate(zip(spacecraft, positions)):
+        spacecraft_info = spacecraft_static_info(sc)
+        spacecraft_info['time_since_launch'] = OrbitalCalculator.format_time_since_launch(sc['launch_date'], current_time)
         
         spacecraft_info.update({
             'position': {
-                'x': position['x'],
-                'y': position['y'],
-                'z': position['z']
+                'x': position.x,
+                'y': position.y,
+                'z': position.z
             },
-            'distance_sun': OrbitalCalculator.format_distance(position['distance_sun']),
-            'distance_sun_au': position['distance_sun'],
-            'speed_sun': f"{position['speed_sun']:.2f} km/s"
+            'distance_sun': OrbitalCalculator.format_distance(position.distance_sun),
+            'distance_sun_au': position.distance_sun,
+            'speed_sun': _FMT_SPEED(position.speed_sun)
         })
         
         # Calculate relative to Earth
-        if earth_position:
-            sc_pos = {
-                'x': position['x'],
-                'y': position['y'],
-                'z': position['z'],
-                'vx': position['vx'],
-                'vy': position['vy'],
-                'vz': position['vz']
-            }
-            relative = OrbitalCalculator.calculate_relative_to_earth(sc_pos, earth_position)
+        if include_earth_relative and earth_position:
+            relative = OrbitalCalculator.calculate_relative_to_earth(position, earth_position)
             spacecraft_info['distance_earth'] = OrbitalCalculator.format_distance(relative['distance_earth'])
-            spacecraft_info['speed_earth'] = f"{relative['speed_earth']:.2f} km/s"
+            spacecraft_info['speed_earth'] = _FMT_SPEED(relative['speed_earth'])
         
         # Calculate distance to target body for active spacecraft
         # Only for probes that haven't arrived yet (no arrival_time or arrival_time is in future)
@@ -291,96 +481,61 @@ def get_solar_system_data():
             has_arrived = False
             if sc['arrival_time']:
                 try:
-                    arrival_date = datetime.strptime(sc['arrival_time'], '%Y-%m-%d')
-                    has_arrived = arrival_date <= current_time
-                except:
+                    has_arrived = parse_ymd(sc['arrival_time']) <= current_time
+                except ValueError:
                     pass
             
             # Only calculate target distance if not arrived and target is a known planet
             if not has_arrived and sc['target_body']:
-                target_planet = None
-                
-                # Map target body to planet name_en
-                target_mapping = {
-                    'Jupiter': 'Jupiter',
-                    'Saturn': 'Saturn',
-                    'Mars': 'Mars',
-                    'Sun': None,  # Sun is not in planets table
-                    'Europa': 'Jupiter',  # Europa orbits Jupiter
-                    'Interstellar space': None,
-                    'Trojan asteroids': None,
-                    'Kuiper Belt': None
-                }
-                
-                planet_name_en = target_mapping.get(sc['target_body'])
-                
-                if planet_name_en:
-                    target_planet = next((p for p in result['planets'] if p['name_en'] == planet_name_en), None)
+                target_pos = planet_positions.get(TARGET_BODY_PLANETS.get(sc['target_body']))
                 
-                if target_planet:
-                    target_pos = {
-                        'x': target_planet['position']['x'],
-                        'y': target_planet['position']['y'],
-                        'z': target_planet['position']['z']
-                    }
-                    
-                    distance_to_target_au = OrbitalCalculator.calculate_distance_to_target(
-                        {'x': position['x'], 'y': position['y'], 'z': position['z']},
-                        target_pos
-                    )
+                if target_pos:
+                    distance_to_target_au = OrbitalCalculator.calculate_distance_to_target(position, target_pos)
                     
                     spacecraft_info['target_distance'] = distance_to_target_au
                     spacecraft_info['target_position_known'] = True
         
-        # Sort into active/inactive (maintaining launch_date order)
-        if sc['status'] == 'active':
-            active_spacecraft.append(spacecraft_info)
-        else:
-            inactive_spacecraft.append(spacecraft_info)
-    
-    # Combine: active first, then inactive (both in launch_date order)
-    result['spacecraft'] = active_spacecraft + inactive_spacecraft
-    result['inactive_count'] = len(inactive_spacecraft)
-    
-    conn.close()
+        if sc['status'] != 'active':
+            inactive_count += 1
+        
+        yield (b',' if index else b'') + dumps(spacecraft_info)
     
-    return jsonify(result)
+    yield b'],"inactive_count":' + dumps(inactive_count) + b'}'
+
+# Pressure display units as (lower bound in Pa, Pa per unit, formatter), ascending by bound
+_PRESSURE_UNITS = (
+    (1e-9, 1e-9, '{:.2f} nPa'.format),
+    (1e-6, 1e-6, '{:.2f} µPa'.format),
+    (1e-3, 1e-3, '{:.2f} mPa'.format),
+    (1, 1, '{:.2f} Pa'.format),
+    (100, 100, '{:.1f} hPa'.format),
+    (1000, 1000, '{:.2f} kPa'.format),
+    (101325, 101325, '{:.2f} atm'.format),  # 1 atm in Pa
+    (1e6, 1e6, '{:.2f} MPa'.format),
+)
+_PRESSURE_THRESHOLDS = [bound for bound, _, _ in _PRESSURE_UNITS]
 
 def format_atmospheric_pressure(pressure):
     """Format atmospheric pressure in human-readable format"""
     if pressure is None:
         return '无大气层'
     
-    # Define thresholds for different units
-    ATM = 101325  # 1 atm in Pa
-    KPA = 1000    # 1 kPa in Pa
-    HPA = 100     # 1 hPa in Pa
-    MPA = 1e6     # 1 MPa in Pa
-    
-    # Choose appropriate unit based on magnitude
-    if pressure >= MPA:
-        return f"{pressure/MPA:.2f} MPa"
-    elif pressure >= ATM:
-        return f"{pressure/ATM:.2f} atm"
-    elif pressure >= KPA:
-        return f"{pressure/KPA:.2f} kPa"
-    elif pressure >= HPA:
-        return f"{pressure/HPA:.1f} hPa"
-    elif pressure >= 1:
-        return f"{pressure:.2f} Pa"
-    elif pressure >= 1e-3:
-        return f"{pressure*1e3:.2f} mPa"
-    elif pressure >= 1e-6:
-        return f"{pressure*1e6:.2f} µPa"
-    elif pressure >= 1e-9:
-        return f"{pressure*1e9:.2f} nPa"
-    else:
+    # Pick the largest unit whose lower bound the pressure reaches
+    index = bisect_right(_PRESSURE_THRESHOLDS, pressure) - 1
+    if index < 0:
         return f"{pressure:.2e} Pa"
+    
+    _, unit_pa, formatter = _PRESSURE_UNITS[index]
+    return formatter(pressure / unit_pa)
 
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
     return jsonify({'status': 'ok', 'timestamp': datetime.now().isoformat()})
 
+# Each worker process runs its own ticker; requests that arrive before it has
+# filled the current bucket fall back to computing the response themselves
+threading.Thread(target=_ticker, name='solar-system-ticker', daemon=True).start()
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5001)
@@ -1,34 +1,450 @@
 import numpy as np
+import functools
 import math
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass
+from typing import NamedTuple
+from numba import njit
+from datetime import datetime, timedelta, timezone
 
 # Astronomical constants
 AU = 1.496e8  # Astronomical Unit in km
 G = 6.67430e-20  # Gravitational constant in km^3 kg^-1 s^-2
 M_SUN = 1.989e30  # Mass of Sun in kg
 M_EARTH = 5.972e24  # Mass of Earth in kg
+MU_SUN = G * M_SUN  # Sun's gravitational parameter in km^3/s^2
+MU_AU = MU_SUN / AU  # in km^2/s^2, so v^2 = MU_AU * (2/r - 1/a) with r and a in AU
 DAY_SECONDS = 86400  # Seconds in a day
 YEAR_SECONDS = 365.25 * DAY_SECONDS  # Seconds in a year
+J2000_DATETIME = datetime(2000, 1, 1, 12)  # J2000.0 epoch
+J2000_DATETIME64 = np.datetime64('2000-01-01T12:00:00')
+JD_J2000 = 2451545.0  # Julian date of J2000.0
+
+# Spacecraft model constants by target body
+BODY_DISTANCE_AU = {  # average distance from the Sun
+    'Mars': 1.5,
+    'Jupiter': 5.2,
+    'Saturn': 9.5,
+    'Europa': 5.2,
+    'Trojan asteroids': 5.2,
+}
+BODY_ORBITAL_SPEED_KMS = {  # average orbital speed, for spacecraft that have arrived
+    'Mars': 24.1,
+    'Jupiter': 13.1,
+    'Saturn': 9.7,
+}
+# Rovers and landers move with their target; other targets use Earth's speed
+SURFACE_SPEED_KMS = {body: BODY_ORBITAL_SPEED_KMS[body] for body in ('Mars', 'Jupiter')}
+TRANSIT_YEARS = {  # assumed travel time from Earth
+    'Mars': 0.55,
+    'Jupiter': 6.0,
+    'Saturn': 7.0,
+    'Europa': 6.0,
+    'Trojan asteroids': 12.0,
+}
+# Active spacecraft bound for a TRANSIT_YEARS target sit at its distance instead of
+# in transit once they have arrived at one of these targets...
+AT_TARGET_ON_ARRIVAL = ('Jupiter', 'Saturn')
+# ...or from launch on when the trajectory type contains one of these
+AT_TARGET_TRAJECTORIES = {
+    'Jupiter': ('orbiter',),
+    'Mars': ('rover', 'lander'),
+}
+INACTIVE_DRIFT_AU = {  # (distance at launch, outward drift per year) for inactive spacecraft
+    'Mars': (1.5, 0.05),
+    'Jupiter': (5.2, 0.1),
+    'Saturn': (9.5, 0.1),
+    'Interstellar space': (30, 2),
+}
+INACTIVE_DRIFT_DEFAULT_AU = (1.0, 0.5)
+# Parker Solar Probe: highly elliptical 88-day orbit, perihelion 0.046 AU, aphelion 0.73 AU
+PARKER_PERIOD_YEARS = 0.24
+PARKER_A_AU = (0.046 + 0.73) / 2
+
+class BodyState(NamedTuple):
+    """Position and velocity of a body, as returned by the OrbitalCalculator routines"""
+    x: float  # AU
+    y: float  # AU
+    z: float  # AU
+    vx: float  # km/s
+    vy: float  # km/s
+    vz: float  # km/s
+    distance_sun: float  # AU
+    speed_sun: float  # km/s
+
+# Structured dtype of the batch routines' results, one field per BodyState field
+BODY_STATE_DTYPE = np.dtype([(name, float) for name in BodyState._fields])
+
+@njit(cache=True, fastmath=True)
+def _vis_viva_speed(r, a):
+    """
+    Orbital speed in km/s from the vis-viva equation v^2 = GM(2/r - 1/a)
+    r (distance from the Sun) and a (semi-major axis) in AU
+    """
+    return math.sqrt(MU_AU * (2/r - 1/a))
+
+@njit(cache=True, fastmath=True)
+def _sincos(x):
+    """
+    (sin(x), cos(x)) from Taylor polynomials, about twice as fast as two libm calls
+    x is reduced to [-pi, pi] and folded to [-pi/2, pi/2]; absolute error < 1e-11
+    """
+    x = x - 2 * math.pi * round(x / (2 * math.pi))
+    cos_sign = 1.0
+    if x > 0.5 * math.pi:
+        x = math.pi - x
+        cos_sign = -1.0
+    elif x < -0.5 * math.pi:
+        x = -math.pi - x
+        cos_sign = -1.0
+    x2 = x * x
+    s = x * (1 + x2 * (-1/6 + x2 * (1/120 + x2 * (-1/5040 + x2 * (1/362880
+        + x2 * (-1/39916800 + x2 * (1/6227020800 + x2 * (-1/1307674368000))))))))
+    c = 1 + x2 * (-1/2 + x2 * (1/24 + x2 * (-1/720 + x2 * (1/40320 + x2 * (-1/3628800
+        + x2 * (1/479001600 + x2 * (-1/87178291200 + x2 * (1/20922789888000))))))))
+    return s, cos_sign * c
+
+@njit(cache=True, fastmath=True)
+def _prepared_planet_state(a, e, M0, n, sqrt_1_e2, r11, r12, r21, r22, r31, r32, t):
+    """
+    Time-dependent part of _planet_state, given the per-planet invariants of _PreparedOrbit
+    a in AU, M0 in radians, n in radians/second, t (since J2000.0) in seconds
+    Returns (x, y, z, vx, vy, vz, distance_sun, speed_sun)
+    """
+    # Calculate mean anomaly
+    M = M0 + n * t
+    
+    # Solve Kepler's equation for eccentric anomaly (E)
+    # M = E - e*sin(E)
+    # Start from the third-order series in e (within ~1e-4 of the root for
+    # planetary eccentricities), then Newton-Raphson until E stops changing
+    sin_M, cos_M = _sincos(M)
+    sin_2M = 2 * sin_M * cos_M
+    sin_3M = 3 * sin_M - 4 * sin_M**3
+    E = M + e * sin_M + 0.5 * e * e * sin_2M + e**3 / 8 * (3 * sin_3M - sin_M)
+    E_prev = E
+    sin_E, cos_E = _sincos(E)
+    for k in range(10):  # Newton-Raphson iteration
+        E_next = E - (E - e * sin_E - M) / (1 - e * cos_E)
+        # Converged when the iterate repeats (or cycles between two values)
+        if E_next == E or E_next == E_prev:
+            E = E_next
+            break
+        dE = E_next - E
+        E_prev = E
+        E = E_next
+        # Small steps advance sin/cos by the angle-sum identities (the dE series
+        # are exact in double precision for |dE| < 1e-4); refresh every 3rd step
+        if abs(dE) < 1e-4 and k % 3 != 2:
+            sin_dE = dE - dE**3 / 6
+            cos_dE = 1 - 0.5 * dE * dE
+            sin_E, cos_E = sin_E * cos_dE + cos_E * sin_dE, cos_E * cos_dE - sin_E * sin_dE
+        else:
+            sin_E, cos_E = _sincos(E)
+    
+    # True anomaly (nu) straight from E, without the half-angle atan2:
+    # cos(nu) = (cos(E) - e) / (1 - e*cos(E)), sin(nu) = sqrt(1 - e^2)*sin(E) / (1 - e*cos(E))
+    sin_E, cos_E = _sincos(E)
+    denom = 1 - e * cos_E
+    cos_nu = (cos_E - e) / denom
+    sin_nu = sqrt_1_e2 * sin_E / denom
+    
+    # Calculate distance from Sun (r)
+    r = a * denom  # in AU
+    
+    # Calculate position in orbital plane (r*cos(nu), r*sin(nu))
+    x_orbital = a * (cos_E - e)
+    y_orbital = a * sqrt_1_e2 * sin_E
+    
+    # Rotate to the ecliptic with R (applied to both position and velocity)
+    x_ecliptic = r11 * x_orbital + r12 * y_orbital
+    y_ecliptic = r21 * x_orbital + r22 * y_orbital
+    z_ecliptic = r31 * x_orbital + r32 * y_orbital
+    
+    # Calculate velocity (simplified)
+    # Vis-viva equation: v^2 = GM(2/r - 1/a)
+    v_orbital = _vis_viva_speed(r, a)  # in km/s
+    
+    # Velocity components (simplified, directed along orbit)
+    vx_orbital = -v_orbital * sin_nu
+    vy_orbital = v_orbital * sqrt_1_e2 * cos_nu
+    
+    # Transform velocity to ecliptic coordinates
+    vx_ecliptic = r11 * vx_orbital + r12 * vy_orbital
+    vy_ecliptic = r21 * vx_orbital + r22 * vy_orbital
+    vz_ecliptic = r31 * vx_orbital + r32 * vy_orbital
+    
+    return x_ecliptic, y_ecliptic, z_ecliptic, vx_ecliptic, vy_ecliptic, vz_ecliptic, r, v_orbital
+
+@njit(cache=True, fastmath=True)
+def _planet_state(a, e, i, period, M0, w0, O0, t):
+    """
+    Numeric core of OrbitalCalculator.calculate_planet_position
+    a in AU, angles in radians, period and t (since J2000.0) in seconds
+    Returns (x, y, z, vx, vy, vz, distance_sun, speed_sun)
+    """
+    # Calculate mean motion
+    n = 2 * math.pi / period
+    
+    # Orbital plane -> ecliptic rotation R = Rz(O0) Rx(i) Rz(w0), computed once
+    # and applied to both position and velocity (both have zero z in the orbital plane)
+    sin_w, cos_w = _sincos(w0)
+    sin_i, cos_i = _sincos(i)
+    sin_O, cos_O = _sincos(O0)
+    r11 = cos_O * cos_w - sin_O * sin_w * cos_i
+    r12 = -cos_O * sin_w - sin_O * cos_w * cos_i
+    r21 = sin_O * cos_w + cos_O * sin_w * cos_i
+    r22 = -sin_O * sin_w + cos_O * cos_w * cos_i
+    r31 = sin_w * sin_i
+    r32 = cos_w * sin_i
+    
+    return _prepared_planet_state(a, e, M0, n, math.sqrt(1 - e * e),
+                                  r11, r12, r21, r22, r31, r32, t)
+
+@njit(cache=True, fastmath=True)
+def _moon_state(a, period, i, t, px, py, pz, pvx, pvy, pvz):
+    """
+    Numeric core of OrbitalCalculator.calculate_moon_position
+    a in AU, period and t (since J2000.0) in seconds, i in radians,
+    (px, py, pz, pvx, pvy, pvz) is the parent planet's position and velocity
+    Returns (x, y, z, vx, vy, vz, distance_sun, speed_sun)
+    """
+    # Simplified circular orbit for moons
+    n = 2 * math.pi / period
+    
+    # Mean anomaly (assuming M0 = 0 for simplicity)
+    M = n * t
+    
+    # Position in orbital plane
+    x_orbital = a * math.cos(M)
+    y_orbital = a * math.sin(M)
+    
+    # Transform to ecliptic (simplified) and add parent planet position
+    x_sun = px + x_orbital
+    y_sun = py + y_orbital * math.cos(i)
+    z_sun = pz + y_orbital * math.sin(i)
+    
+    # Calculate velocity relative to Sun (parent velocity + moon orbital velocity)
+    # Moon orbital speed in km/s
+    v_moon = 2 * math.pi * a * AU / period  # v = 2πa/T, where T is in seconds
+    
+    # Velocity components in orbital plane
+    vx_orbital = -v_moon * math.sin(M)
+    vy_orbital = v_moon * math.cos(M)
+    
+    # Total velocity = parent velocity + moon orbital velocity (transformed to ecliptic)
+    vx_total = pvx + vx_orbital
+    vy_total = pvy + vy_orbital * math.cos(i)
+    vz_total = pvz + vy_orbital * math.sin(i)
+    
+    distance_sun = math.sqrt(x_sun * x_sun + y_sun * y_sun + z_sun * z_sun)
+    speed_sun = math.sqrt(vx_total * vx_total + vy_total * vy_total + vz_total * vz_total)
+    
+    return x_sun, y_sun, z_sun, vx_total, vy_total, vz_total, distance_sun, speed_sun
+
+@njit(cache=True, fastmath=True)
+def _sample_planet_trajectory(a, e, M0, n, sqrt_1_e2, r11, r12, r21, r22, r31, r32, t_start, t_end, out):
+    """
+    Numeric core of OrbitalCalculator.sample_trajectory
+    Writes x, y, z, vx, vy, vz at len(out) evenly spaced times from t_start to t_end
+    (seconds since J2000.0) into the rows of out, without allocating
+    """
+    n_samples = out.shape[0]
+    step = (t_end - t_start) / (n_samples - 1) if n_samples > 1 else 0.0
+    for k in range(n_samples):
+        x, y, z, vx, vy, vz, r, v = _prepared_planet_state(
+            a, e, M0, n, sqrt_1_e2, r11, r12, r21, r22, r31, r32, t_start + k * step
+        )
+        out[k, 0] = x
+        out[k, 1] = y
+        out[k, 2] = z
+        out[k, 3] = vx
+        out[k, 4] = vy
+        out[k, 5] = vz
+
+# Compile (or load from the on-disk cache) at import so the first request doesn't pay for it
+_planet_state(1.0, 0.0167, 0.0, YEAR_SECONDS, 0.0, 0.0, 0.0, 0.0)
+_prepared_planet_state(1.0, 0.0167, 0.0, 2 * math.pi / YEAR_SECONDS, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0)
+_moon_state(0.00257, 27.3 * DAY_SECONDS, 0.09, 0.0, 1.0, 0.0, 0.0, 0.0, 30.0, 0.0)
+_vis_viva_speed(1.0, 1.0)
+_sincos(1.0)
+_sample_planet_trajectory(1.0, 0.0167, 0.0, 2 * math.pi / YEAR_SECONDS, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0, 0.0,
+                          0.0, YEAR_SECONDS, np.empty((2, 6)))
+
+def _body_state_array(*fields):
+    """Pack x, y, z, vx, vy, vz, distance_sun, speed_sun arrays into one BODY_STATE_DTYPE array"""
+    fields = np.broadcast_arrays(*fields)
+    states = np.empty(fields[0].shape, dtype=BODY_STATE_DTYPE)
+    for name, values in zip(BodyState._fields, fields):
+        states[name] = values
+    return states
+
+@dataclass(frozen=True)
+class _PreparedOrbit:
+    """
+    Time-independent quantities of one or more planet orbits (see OrbitalCalculator.prepare)
+    Fields are floats, or arrays with one entry per planet
+    """
+    a: np.ndarray  # semi-major axis in AU
+    e: np.ndarray  # eccentricity
+    M0: np.ndarray  # mean anomaly at J2000.0 in radians
+    n: np.ndarray  # mean motion in radians/second
+    sqrt_1_e2: np.ndarray  # sqrt(1 - e^2)
+    # First two columns of the orbital plane -> ecliptic rotation R = Rz(O0) Rx(i) Rz(w0)
+    r11: np.ndarray
+    r12: np.ndarray
+    r21: np.ndarray
+    r22: np.ndarray
+    r31: np.ndarray
+    r32: np.ndarray
+
+def _planet_states_array(prep, t):
+    """
+    NumPy core of OrbitalCalculator.calculate_planet_positions(_batch)
+    prep: _PreparedOrbit whose arrays broadcast against t (seconds since J2000.0)
+    Returns a BODY_STATE_DTYPE array
+    """
+    a, e, sqrt_1_e2 = prep.a, prep.e, prep.sqrt_1_e2
+    r11, r12, r21, r22, r31, r32 = prep.r11, prep.r12, prep.r21, prep.r22, prep.r31, prep.r32
+
+    M = prep.M0 + prep.n * t
+
+    # Solve Kepler's equation for all planets at once: third-order series seed,
+    # then Newton-Raphson until no element changes any more
+    sin_M = np.sin(M)
+    sin_2M = 2 * sin_M * np.cos(M)
+    sin_3M = 3 * sin_M - 4 * sin_M**3
+    E = M + e * sin_M + 0.5 * e * e * sin_2M + e**3 / 8 * (3 * sin_3M - sin_M)
+    E_prev = E
+    for _ in range(8):
+        E_next = E - (E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+        # Converged when every iterate repeats (or cycles between two values)
+        if np.all((E_next == E) | (E_next == E_prev)):
+            E = E_next
+            break
+        E_prev = E
+        E = E_next
+
+    # True anomaly from E, as in _planet_state
+    sin_E, cos_E = np.sin(E), np.cos(E)
+    denom = 1 - e * cos_E
+    cos_nu = (cos_E - e) / denom
+    sin_nu = sqrt_1_e2 * sin_E / denom
+    r = a * denom  # in AU
+
+    # Position in the orbital plane, rotated to the ecliptic
+    x_orbital = a * (cos_E - e)
+    y_orbital = a * sqrt_1_e2 * sin_E
+    x_ecliptic = r11 * x_orbital + r12 * y_orbital
+    y_ecliptic = r21 * x_orbital + r22 * y_orbital
+    z_ecliptic = r31 * x_orbital + r32 * y_orbital
+
+    # Vis-viva speed and velocity components (same simplification as the scalar version)
+    v_orbital = np.sqrt(MU_AU * (2/r - 1/a))  # in km/s
+    vx_orbital = -v_orbital * sin_nu
+    vy_orbital = v_orbital * sqrt_1_e2 * cos_nu
+    vx_ecliptic = r11 * vx_orbital + r12 * vy_orbital
+    vy_ecliptic = r21 * vx_orbital + r22 * vy_orbital
+    vz_ecliptic = r31 * vx_orbital + r32 * vy_orbital
+
+    return _body_state_array(x_ecliptic, y_ecliptic, z_ecliptic,
+                             vx_ecliptic, vy_ecliptic, vz_ecliptic, r, v_orbital)
+
+@functools.lru_cache(maxsize=256)
+def _time_cache(dt):
+    """
+    Julian date, days and seconds since J2000.0 for a datetime
+    Naive datetimes are taken as UTC; aware ones are converted to UTC first
+    Cached, so the bodies of one frame (which share a timestamp) compute it once
+    """
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    t = (dt - J2000_DATETIME).total_seconds()
+    days = t / DAY_SECONDS
+    return days + JD_J2000, days, t
+
+@functools.lru_cache(maxsize=1024)
+def parse_ymd(date_str):
+    """
+    Parse a YYYY-MM-DD string as a datetime (ValueError if invalid)
+    Cached, since the same launch and arrival dates are parsed on every frame
+    """
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+# Last datetime.now() and the time.monotonic() it was taken at, see _now
+_NOW_CACHE = {}
+
+def _now():
+    """
+    datetime.now(), refreshed at most once a second
+    Spacecraft positions and launch ages only need second resolution, so one frame shares a clock read
+    """
+    now = _NOW_CACHE.get('t')
+    if now is None or time.monotonic() - _NOW_CACHE['ts'] > 1.0:
+        now = datetime.now()
+        _NOW_CACHE.update(t=now, ts=time.monotonic())
+    return now
+
+def _to_datetime64(date_str):
+    """Parse a YYYY-MM-DD string as datetime64, NaT if missing or invalid"""
+    try:
+        return np.datetime64(date_str, 'D') if date_str else np.datetime64('NaT')
+    except ValueError:
+        return np.datetime64('NaT')
 
 class OrbitalCalculator:
     """Calculate orbital positions and velocities for celestial bodies"""
     
     @staticmethod
     def julian_date(dt):
-        """Convert datetime to Julian Date"""
-        a = (14 - dt.month) // 12
-        y = dt.year + 4800 - a
-        m = dt.month + 12 * a - 3
-        
-        jdn = dt.day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
-        jd = jdn + (dt.hour - 12) / 24 + dt.minute / 1440 + dt.second / 86400 + dt.microsecond / 86400000000
-        return jd
+        """Convert datetime to Julian Date (naive datetimes are taken as UTC)"""
+        return _time_cache(dt)[0]
     
     @staticmethod
     def days_since_epoch(jd):
         """Calculate days since J2000.0 epoch (January 1, 2000, 12:00 TT)"""
-        jd2000 = 2451545.0
-        return jd - jd2000
+        return jd - JD_J2000
+    
+    @staticmethod
+    def prepare(orbital_elements):
+        """
+        Precompute the time-independent part of the planet orbit calculation
+        orbital_elements: as for calculate_planet_position (floats), or
+                          calculate_planet_positions_batch (arrays)
+        Returns a _PreparedOrbit for calculate_planet_position(s)_prepared
+        """
+        a = np.asarray(orbital_elements['semi_major_axis'], dtype=float)  # AU
+        e = np.asarray(orbital_elements['eccentricity'], dtype=float)
+        i = np.radians(orbital_elements['inclination'])
+        period = np.asarray(orbital_elements['orbital_period'], dtype=float) * YEAR_SECONDS
+        M0 = np.radians(orbital_elements['mean_anomaly_0'])
+        O0 = np.radians(orbital_elements['ascending_node_0'])
+        # Argument of perihelion from the stored longitude of perihelion (w = lon - O)
+        w0 = np.radians(np.subtract(orbital_elements['perihelion_0'], orbital_elements['ascending_node_0']))
+        
+        # Orbital plane -> ecliptic rotation R = Rz(O0) Rx(i) Rz(w0), as in _planet_state
+        cos_w, sin_w = np.cos(w0), np.sin(w0)
+        cos_i, sin_i = np.cos(i), np.sin(i)
+        cos_O, sin_O = np.cos(O0), np.sin(O0)
+        
+        fields = {
+            'a': a,
+            'e': e,
+            'M0': M0,
+            'n': 2 * np.pi / period,
+            'sqrt_1_e2': np.sqrt(1 - e * e),
+            'r11': cos_O * cos_w - sin_O * sin_w * cos_i,
+            'r12': -cos_O * sin_w - sin_O * cos_w * cos_i,
+            'r21': sin_O * cos_w + cos_O * sin_w * cos_i,
+            'r22': -sin_O * sin_w + cos_O * cos_w * cos_i,
+            'r31': sin_w * sin_i,
+            'r32': cos_w * sin_i
+        }
+        if a.ndim == 0:
+            # Plain floats for a single planet, so the Numba kernel gets scalar arguments
+            fields = {name: float(value) for name, value in fields.items()}
+        
+        return _PreparedOrbit(**fields)
     
     @staticmethod
     def calculate_planet_position(orbital_elements, current_time):
@@ -36,6 +452,7 @@ class OrbitalCalculator:
         Calculate planet position using orbital elements
         orbital_elements: dict with semi_major_axis, eccentricity, inclination,
                          orbital_period, mean_anomaly_0, perihelion_0, ascending_node_0
+                         (perihelion_0 is the longitude of perihelion, ascending node + argument of perihelion)
         """
         # Get orbital elements
         a = orbital_elements['semi_major_axis']  # AU
@@ -43,157 +460,119 @@ class OrbitalCalculator:
         i = math.radians(orbital_elements['inclination'])  # Convert to radians
         period = orbital_elements['orbital_period'] * YEAR_SECONDS  # Convert to seconds
         M0 = math.radians(orbital_elements['mean_anomaly_0'])  # Mean anomaly at epoch
-        w0 = math.radians(orbital_elements['perihelion_0'])  # Perihelion at epoch
         O0 = math.radians(orbital_elements['ascending_node_0'])  # Ascending node at epoch
-        
-        # Calculate mean motion
-        n = 2 * math.pi / period
+        # Argument of perihelion = longitude of perihelion - ascending node (precession ignored)
+        w0 = math.radians(orbital_elements['perihelion_0'] - orbital_elements['ascending_node_0'])
         
         # Calculate time since epoch (using J2000.0 as reference)
-        jd = OrbitalCalculator.julian_date(current_time)
-        days = OrbitalCalculator.days_since_epoch(jd)
-        t = days * DAY_SECONDS
-        
-        # Calculate mean anomaly
-        M = M0 + n * t
-        
-        # Solve Kepler's equation for eccentric anomaly (E)
-        # M = E - e*sin(E)
-        E = M
-        for _ in range(10):  # Newton-Raphson iteration
-            E = E - (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
-        
-        # Calculate true anomaly (nu)
-        nu = 2 * math.atan2(math.sqrt(1 + e) * math.sin(E/2), 
-                            math.sqrt(1 - e) * math.cos(E/2))
-        
-        # Calculate distance from Sun (r)
-        r = a * (1 - e * math.cos(E))  # in AU
-        
-        # Calculate position in orbital plane
-        x_orbital = r * math.cos(nu)
-        y_orbital = r * math.sin(nu)
-        z_orbital = 0
-        
-        # Transform to ecliptic coordinates
-        # Argument of perihelion (w) = w0 (simplified, precession ignored)
-        w = w0
-        
-        # Rotation for inclination (i)
-        x1 = x_orbital
-        y1 = y_orbital * math.cos(i) - z_orbital * math.sin(i)
-        z1 = y_orbital * math.sin(i) + z_orbital * math.cos(i)
-        
-        # Rotation for longitude of ascending node (O0)
-        x_ecliptic = x1 * math.cos(O0) - y1 * math.sin(O0)
-        y_ecliptic = x1 * math.sin(O0) + y1 * math.cos(O0)
-        z_ecliptic = z1
-        
-        # Calculate velocity (simplified)
-        # Vis-viva equation: v^2 = GM(2/r - 1/a)
-        mu = G * M_SUN
-        v_orbital = math.sqrt(mu * (2/(r*AU) - 1/(a*AU)))  # in km/s
-        
-        # Velocity components (simplified, directed along orbit)
-        vx_orbital = -v_orbital * math.sin(nu)
-        vy_orbital = v_orbital * math.sqrt(1 - e**2) * math.cos(nu)
-        vz_orbital = 0
-        
-        # Transform velocity to ecliptic coordinates
-        vx1 = vx_orbital
-        vy1 = vy_orbital * math.cos(i) - vz_orbital * math.sin(i)
-        vz1 = vy_orbital * math.sin(i) + vz_orbital * math.cos(i)
-        
-        vx_ecliptic = vx1 * math.cos(O0) - vy1 * math.sin(O0)
-        vy_ecliptic = vx1 * math.sin(O0) + vy1 * math.cos(O0)
-        vz_ecliptic = vz1
+        jd, days, t = _time_cache(current_time)
         
-        return {
-            'x': x_ecliptic,  # AU
-            'y': y_ecliptic,  # AU
-            'z': z_ecliptic,  # AU
-            'vx': vx_ecliptic,  # km/s
-            'vy': vy_ecliptic,  # km/s
-            'vz': vz_ecliptic,  # km/s
-            'distance_sun': r,  # AU
-            'speed_sun': v_orbital  # km/s
-        }
+        return BodyState(*_planet_state(a, e, i, period, M0, w0, O0, t))
+    
+    @staticmethod
+    def calculate_planet_position_prepared(prep, current_time):
+        """
+        Calculate planet position from a single-planet prepare() result
+        Same result as calculate_planet_position, without redoing the per-planet setup
+        """
+        jd, days, t = _time_cache(current_time)
+        
+        return BodyState(*_prepared_planet_state(
+            prep.a, prep.e, prep.M0, prep.n, prep.sqrt_1_e2,
+            prep.r11, prep.r12, prep.r21, prep.r22, prep.r31, prep.r32, t
+        ))
+    
+    @staticmethod
+    def calculate_planet_positions_batch(elements_arrays, current_time):
+        """
+        Calculate positions of many planets at once using NumPy arrays
+        elements_arrays: dict with the same keys as calculate_planet_position's
+                         orbital_elements, each an array with one entry per planet
+        Returns a BODY_STATE_DTYPE array (fields x, y, z, vx, vy, vz, distance_sun, speed_sun)
+        """
+        return OrbitalCalculator.calculate_planet_positions_prepared(
+            OrbitalCalculator.prepare(elements_arrays), current_time)
+    
+    @staticmethod
+    def calculate_planet_positions_prepared(prep, current_time):
+        """
+        Calculate positions of many planets at once from a prepare() result
+        built from element arrays (see calculate_planet_positions_batch)
+        Returns a BODY_STATE_DTYPE array (fields x, y, z, vx, vy, vz, distance_sun, speed_sun)
+        """
+        jd, days, t = _time_cache(current_time)
+        
+        return _planet_states_array(prep, t)
+    
+    @staticmethod
+    def calculate_planet_positions(elements_arrays, times):
+        """
+        Calculate positions of many planets at many times at once
+        elements_arrays: as for calculate_planet_positions_batch (N planets)
+        times: M datetimes, or a datetime64 array
+        Returns an (N, M) BODY_STATE_DTYPE array (fields x, y, z, vx, vy, vz, distance_sun, speed_sun)
+        """
+        times = np.asarray(times, dtype='datetime64[us]')
+        t = (times - J2000_DATETIME64) / np.timedelta64(1, 's')
+        
+        # Planets along the first axis, times along the second
+        elements = {key: np.asarray(values, dtype=float)[:, np.newaxis] for key, values in elements_arrays.items()}
+        return _planet_states_array(OrbitalCalculator.prepare(elements), t)
+    
+    @staticmethod
+    def sample_trajectory(orbital_elements, t_start, t_end, n_samples, out=None):
+        """
+        Sample a planet's orbit at n_samples evenly spaced times from t_start to t_end (datetimes),
+        e.g. for drawing an orbit trail
+        orbital_elements: as for calculate_planet_position, or a single-planet prepare() result
+        out: optional (n_samples, 6) float array to fill, so a renderer can reuse one buffer per frame
+        Returns out (or a new array) with rows x, y, z (AU), vx, vy, vz (km/s)
+        """
+        prep = orbital_elements
+        if not isinstance(prep, _PreparedOrbit):
+            prep = OrbitalCalculator.prepare(orbital_elements)
+        
+        if out is None:
+            out = np.empty((n_samples, 6))
+        elif out.shape != (n_samples, 6) or out.dtype != np.float64:
+            raise ValueError(f"out must be a float64 array of shape ({n_samples}, 6)")
+        
+        _sample_planet_trajectory(
+            prep.a, prep.e, prep.M0, prep.n, prep.sqrt_1_e2,
+            prep.r11, prep.r12, prep.r21, prep.r22, prep.r31, prep.r32,
+            _time_cache(t_start)[2], _time_cache(t_end)[2], out
+        )
+        return out
     
     @staticmethod
     def calculate_moon_position(moon_data, parent_position, current_time):
         """
         Calculate moon position relative to Sun (parent planet position + moon orbit)
         moon_data: dict with semi_major_axis, orbital_period, inclination
-        parent_position: dict with x, y, z, vx, vy, vz of parent planet
+        parent_position: BodyState of the parent planet
         """
         a = moon_data['semi_major_axis'] / AU  # Convert km to AU
         period = moon_data['orbital_period'] * DAY_SECONDS  # Convert to seconds
         i = math.radians(moon_data['inclination'])
         
-        # Simplified circular orbit for moons
-        n = 2 * math.pi / period
-        
         # Time since J2000.0
-        jd = OrbitalCalculator.julian_date(current_time)
-        days = OrbitalCalculator.days_since_epoch(jd)
-        t = days * DAY_SECONDS
-        
-        # Mean anomaly (assuming M0 = 0 for simplicity)
-        M = n * t
-        
-        # Position in orbital plane
-        x_orbital = a * math.cos(M)
-        y_orbital = a * math.sin(M)
-        z_orbital = 0
-        
-        # Transform to ecliptic (simplified)
-        x_ecliptic = x_orbital
-        y_ecliptic = y_orbital * math.cos(i)
-        z_ecliptic = y_orbital * math.sin(i)
-        
-        # Add parent planet position
-        x_sun = parent_position['x'] + x_ecliptic
-        y_sun = parent_position['y'] + y_ecliptic
-        z_sun = parent_position['z'] + z_ecliptic
-        
-        # Calculate velocity relative to Sun (parent velocity + moon orbital velocity)
-        # Moon orbital speed in km/s
-        v_moon = 2 * math.pi * a * AU / period  # v = 2πa/T, where T is in seconds
-        
-        # Velocity components in orbital plane
-        vx_orbital = -v_moon * math.sin(M)
-        vy_orbital = v_moon * math.cos(M)
-        vz_orbital = 0
-        
-        # Transform velocity to ecliptic
-        vx_ecliptic = vx_orbital
-        vy_ecliptic = vy_orbital * math.cos(i)
-        vz_ecliptic = vy_orbital * math.sin(i)
-        
-        # Total velocity = parent velocity + moon orbital velocity
-        vx_total = parent_position['vx'] + vx_ecliptic
-        vy_total = parent_position['vy'] + vy_ecliptic
-        vz_total = parent_position['vz'] + vz_ecliptic
+        jd, days, t = _time_cache(current_time)
         
-        return {
-            'x': x_sun,
-            'y': y_sun,
-            'z': z_sun,
-            'vx': vx_total,
-            'vy': vy_total,
-            'vz': vz_total,
-            'distance_sun': math.sqrt(x_sun**2 + y_sun**2 + z_sun**2),
-            'speed_sun': math.sqrt(vx_total**2 + vy_total**2 + vz_total**2)
-        }
+        px, py, pz, pvx, pvy, pvz, *_ = parent_position
+        
+        return BodyState(*_moon_state(a, period, i, t, px, py, pz, pvx, pvy, pvz))
     
     @staticmethod
-    def calculate_spacecraft_position(spacecraft_data, target_position=None, earth_position=None):
+    def calculate_spacecraft_position(spacecraft_data, target_position=None, earth_position=None, now=None):
         """
         Calculate approximate spacecraft position
         This is a simplified calculation - real spacecraft trajectories require ephemeris data
+        spacecraft_data: spacecraft row (sqlite3.Row or dict) with launch_date, status,
+                         trajectory_type, target_body, name_en, arrival_time, launch_speed
+        now: time to compute the position at (datetime), the current time if None
         """
-        launch_date = datetime.strptime(spacecraft_data['launch_date'], '%Y-%m-%d')
-        current_time = datetime.now()
+        launch_date = parse_ymd(spacecraft_data['launch_date'])
+        current_time = now or _now()
         
         # Calculate time since launch in years
         time_since_launch = (current_time - launch_date).total_seconds() / YEAR_SECONDS
@@ -201,30 +580,37 @@ class OrbitalCalculator:
         status = spacecraft_data['status']
         trajectory_type = spacecraft_data['trajectory_type']
         target_body = spacecraft_data['target_body']
-        name_en = spacecraft_data.get('name_en', '')
+        name_en = spacecraft_data['name_en'] or ''
         
         # Check if spacecraft has arrived at target
         has_arrived = False
-        if spacecraft_data.get('arrival_time'):
+        if spacecraft_data['arrival_time']:
             try:
-                arrival_date = datetime.strptime(spacecraft_data['arrival_time'], '%Y-%m-%d')
+                arrival_date = parse_ymd(spacecraft_data['arrival_time'])
                 has_arrived = arrival_date <= current_time
-            except:
+            except ValueError:
                 pass
         
+        # Shared by position and velocity (simplified, assuming radial trajectory)
+        angle = (time_since_launch * 2 * math.pi) % (2 * math.pi)
+        cos_angle, sin_angle = math.cos(angle), math.sin(angle)
+        
+        if (status != 'inactive' and has_arrived and target_body in AT_TARGET_ON_ARRIVAL
+                and not ('orbiter' in trajectory_type and target_position)
+                and 'rover' not in trajectory_type and 'lander' not in trajectory_type):
+            # Arrived at Jupiter or Saturn: at the target's distance and orbital speed,
+            # so skip the ladders below
+            distance_from_sun = BODY_DISTANCE_AU[target_body]
+            speed = BODY_ORBITAL_SPEED_KMS[target_body]
+            return BodyState(distance_from_sun * cos_angle, distance_from_sun * sin_angle,
+                             distance_from_sun * 0.05 * sin_angle, -speed * sin_angle, speed * cos_angle, 0,
+                             distance_from_sun, speed)
+        
         if status == 'inactive':
             # For inactive spacecraft, estimate position based on last known location
             # This is a rough approximation
-            if target_body == 'Jupiter':
-                distance_from_sun = 5.2 + time_since_launch * 0.1
-            elif target_body == 'Saturn':
-                distance_from_sun = 9.5 + time_since_launch * 0.1
-            elif target_body == 'Mars':
-                distance_from_sun = 1.5 + time_since_launch * 0.05
-            elif target_body == 'Interstellar space':
-                distance_from_sun = 30 + time_since_launch * 2
-            else:
-                distance_from_sun = 1.0 + time_since_launch * 0.5
+            start, drift = INACTIVE_DRIFT_AU.get(target_body, INACTIVE_DRIFT_DEFAULT_AU)
+            distance_from_sun = start + time_since_launch * drift
         else:
             # For active spacecraft
             if target_body == 'Interstellar space':
@@ -233,97 +619,45 @@ class OrbitalCalculator:
                 # Using launch date + constant outward velocity ~3.6 AU/year
                 years_past_1977 = time_since_launch + (1977 - launch_date.year)
                 distance_from_sun = 40 + years_past_1977 * 3.6
-            elif target_body == 'Jupiter':
-                # Juno, etc.
-                if 'orbiter' in trajectory_type or has_arrived:
-                    distance_from_sun = 5.2  # Jupiter's average distance
-                else:
-                    # En route
-                    progress = min(time_since_launch / 6.0, 1.0)  # Assume 6 years to Jupiter
-                    distance_from_sun = 1.0 + progress * 4.2
-            elif target_body == 'Saturn':
-                # Similar logic for Saturn
-                if has_arrived:
-                    distance_from_sun = 9.5  # Saturn's average distance
+            elif target_body in TRANSIT_YEARS:
+                # Planets, Europa and the Trojans: moving out from 1 AU over the transit
+                # time, or at the target's distance (see AT_TARGET_ON_ARRIVAL / AT_TARGET_TRAJECTORIES)
+                if ((has_arrived and target_body in AT_TARGET_ON_ARRIVAL)
+                        or any(kind in trajectory_type for kind in AT_TARGET_TRAJECTORIES.get(target_body, ()))):
+                    progress = 1.0
                 else:
-                    progress = min(time_since_launch / 7.0, 1.0)
-                    distance_from_sun = 1.0 + progress * 8.5
-            elif target_body == 'Mars':
-                if 'rover' in trajectory_type or 'lander' in trajectory_type:
-                    distance_from_sun = 1.5  # Mars' average distance
-                else:
-                    # En route - Mars missions typically take 6-7 months (~0.5-0.6 years)
-                    progress = min(time_since_launch / 0.55, 1.0)
-                    distance_from_sun = 1.0 + progress * 0.5
+                    progress = min(time_since_launch / TRANSIT_YEARS[target_body], 1.0)
+                distance_from_sun = 1.0 + progress * (BODY_DISTANCE_AU[target_body] - 1.0)
             elif target_body == 'Sun':
-                # Parker Solar Probe
-                # Highly elliptical orbit with 88-day period
-                # Perihelion: 0.046 AU, Aphelion: 0.73 AU
-                orbital_period = 0.24  # 88 days in years
-                time_in_orbit = time_since_launch % orbital_period
+                # Parker Solar Probe (see PARKER_PERIOD_YEARS / PARKER_A_AU)
+                time_in_orbit = time_since_launch % PARKER_PERIOD_YEARS
                 
                 # Calculate position in orbit using simple approximation
                 # Using cosine to simulate elliptical orbit variation
-                phase = (time_in_orbit / orbital_period) * 2 * math.pi
-                perihelion = 0.046  # AU
-                aphelion = 0.73     # AU
-                semi_major_axis = (perihelion + aphelion) / 2
+                phase = (time_in_orbit / PARKER_PERIOD_YEARS) * 2 * math.pi
                 
                 # Approximate distance using orbital phase
                 # At phase 0 = perihelion, at phase π = aphelion
-                distance_from_sun = semi_major_axis * (1 - 0.88 * math.cos(phase))
-            elif target_body == 'Europa' or target_body == 'Trojan asteroids' or target_body == 'Kuiper Belt':
-                # En route
-                if target_body == 'Europa':
-                    progress = min(time_since_launch / 6.0, 1.0)
-                    distance_from_sun = 1.0 + progress * 4.2
-                elif target_body == 'Trojan asteroids':
-                    progress = min(time_since_launch / 12.0, 1.0)
-                    distance_from_sun = 1.0 + progress * 4.2
-                else:  # Kuiper Belt
-                    distance_from_sun = 30 + time_since_launch * 1
+                distance_from_sun = PARKER_A_AU * (1 - 0.88 * math.cos(phase))
+            elif target_body == 'Kuiper Belt':
+                distance_from_sun = 30 + time_since_launch * 1
             else:
                 distance_from_sun = 1.0 + time_since_launch * 0.3
         
-        # Calculate position (simplified, assuming radial trajectory)
-        angle = (time_since_launch * 2 * math.pi) % (2 * math.pi)
-        x = distance_from_sun * math.cos(angle)
-        y = distance_from_sun * math.sin(angle)
-        z = distance_from_sun * 0.05 * math.sin(angle)  # Slight inclination
-        
         # Calculate velocity with improved accuracy
         if status == 'inactive':
             # For inactive spacecraft in interstellar space, use a decaying but still substantial speed
             if target_body == 'Interstellar space':
                 # Voyager 1 and 2 are still moving at ~17 km/s and ~15 km/s respectively
-                speed = spacecraft_data.get('launch_speed', 16) * 0.95  # Slight decay over time
+                speed = (spacecraft_data['launch_speed'] or 16) * 0.95  # Slight decay over time
             else:
                 speed = 10 + time_since_launch * 0.1  # Slower decay for other inactive spacecraft
         else:
             if target_body == 'Sun' and name_en == 'Parker Solar Probe':
                 # Parker Solar Probe's speed varies dramatically
                 # At perihelion: ~194 km/s, At aphelion: ~33 km/s
-                # Use vis-viva equation approximation
-                orbital_period = 0.24  # 88 days in years
-                time_in_orbit = time_since_launch % orbital_period
-                phase = (time_in_orbit / orbital_period) * 2 * math.pi
-                
-                # Speed varies inversely with distance
-                perihelion = 0.046  # AU
-                aphelion = 0.73     # AU
-                current_distance = distance_from_sun
-                
-                # Vis-viva approximation: v = sqrt(GM * (2/r - 1/a))
-                # Need to convert everything to consistent units
-                semi_major_axis = (perihelion + aphelion) / 2  # in AU
-                
-                # Use G in km^3 kg^-1 s^-2, M_SUN in kg, distances in km
-                semi_major_axis_km = semi_major_axis * AU
-                current_distance_km = current_distance * AU
-                
-                # Calculate speed using vis-viva equation
-                mu = G * M_SUN  # in km^3/s^2
-                speed = math.sqrt(mu * (2/current_distance_km - 1/semi_major_axis_km))  # in km/s
+                # Vis-viva approximation at the distance from the orbital phase above
+                speed = _vis_viva_speed(distance_from_sun, PARKER_A_AU)  # in km/s
             elif target_body == 'Interstellar space' and ('Voyager' in name_en or 'Pioneer' in name_en):
                 # For Voyager and Pioneer in interstellar space
                 # These probes maintain high velocity due to gravitational assists
@@ -331,7 +665,7 @@ class OrbitalCalculator:
                 # Use a more realistic model: velocity decays slowly with distance
                 # Based on actual data: Voyager 1 ~17 km/s, Voyager 2 ~15 km/s (as of 2024)
                 # The probes maintain roughly their escape velocity from the solar system
-                base_speed = spacecraft_data.get('launch_speed', 16.5)
+                base_speed = spacecraft_data['launch_speed'] or 16.5
                 # Minimal decay - these probes are still moving fast due to gravity assists
                 speed = base_speed * 0.95  # Slight decay from launch
             elif target_body == 'Kuiper Belt' and name_en == 'New Horizons':
@@ -340,68 +674,163 @@ class OrbitalCalculator:
                 speed = 14.5  # Approximate current speed
             elif 'orbiter' in trajectory_type and target_position:
                 # For orbiters, use target body's orbital speed
-                speed = target_position.get('speed_sun', 10)
+                speed = target_position.speed_sun
             elif 'rover' in trajectory_type or 'lander' in trajectory_type:
                 # For rovers/landers, use target body's orbital speed
-                if target_body == 'Mars':
-                    speed = 24.1  # Mars average orbital speed in km/s
-                elif target_body == 'Jupiter':
-                    speed = 13.1  # Jupiter average orbital speed in km/s
+                if target_body in SURFACE_SPEED_KMS:
+                    speed = SURFACE_SPEED_KMS[target_body]
                 else:
-                    speed = earth_position.get('speed_sun', 30) if earth_position else 30
+                    speed = earth_position.speed_sun if earth_position else 30
             elif has_arrived:
                 # Spacecraft has arrived at destination - use target body's speed
-                if target_body == 'Jupiter':
-                    speed = 13.1
-                elif target_body == 'Saturn':
-                    speed = 9.7
-                elif target_body == 'Mars':
-                    speed = 24.1
-                else:
-                    speed = 30  # Default fallback
+                speed = BODY_ORBITAL_SPEED_KMS.get(target_body, 30)  # 30 as default fallback
             else:
                 # For spacecraft en route, use vis-viva equation
                 # Estimate semi-major axis based on Earth's orbit and target distance
                 # Simplified: assume transfer orbit between 1 AU and target distance
                 semi_major_axis = (1.0 + distance_from_sun) / 2
-                semi_major_axis_km = semi_major_axis * AU
-                current_distance_km = distance_from_sun * AU
-                
-                mu = G * M_SUN
-                speed = math.sqrt(mu * (2/current_distance_km - 1/semi_major_axis_km))
-        
-        # Velocity components
-        vx = -speed * math.sin(angle)
-        vy = speed * math.cos(angle)
+                speed = _vis_viva_speed(distance_from_sun, semi_major_axis)
+        
+        # Position and velocity components
+        x = distance_from_sun * cos_angle
+        y = distance_from_sun * sin_angle
+        z = distance_from_sun * 0.05 * sin_angle  # Slight inclination
+        vx = -speed * sin_angle
+        vy = speed * cos_angle
         vz = 0
         
-        return {
-            'x': x,
-            'y': y,
-            'z': z,
-            'vx': vx,
-            'vy': vy,
-            'vz': vz,
-            'distance_sun': distance_from_sun,
-            'speed_sun': speed
-        }
+        return BodyState(x, y, z, vx, vy, vz, distance_from_sun, speed)
+    
+    @staticmethod
+    def calculate_spacecraft_positions_batch(spacecraft_rows, current_time, target_speeds=None, earth_position=None):
+        """
+        Calculate approximate positions of many spacecraft at once using NumPy arrays
+        Same model as calculate_spacecraft_position, with each if/elif branch
+        evaluated as an array mask over all spacecraft
+        spacecraft_rows: sequence of spacecraft rows (see calculate_spacecraft_position)
+        target_speeds: dict of target body -> orbital speed used for orbiters
+                       (the target_position of calculate_spacecraft_position)
+        Returns a BODY_STATE_DTYPE array (fields x, y, z, vx, vy, vz, distance_sun, speed_sun)
+        """
+        if len(spacecraft_rows) == 0:
+            return np.empty(0, dtype=BODY_STATE_DTYPE)
+        
+        target_speeds = target_speeds or {}
+        now = np.datetime64(current_time, 'us')
+        
+        launch = np.array([sc['launch_date'] for sc in spacecraft_rows], dtype='datetime64[D]')
+        arrival = np.array([_to_datetime64(sc['arrival_time']) for sc in spacecraft_rows], dtype='datetime64[D]')
+        target = np.array([sc['target_body'] or '' for sc in spacecraft_rows], dtype=str)
+        trajectory = np.array([sc['trajectory_type'] for sc in spacecraft_rows], dtype=str)
+        name_en = np.array([sc['name_en'] or '' for sc in spacecraft_rows], dtype=str)
+        launch_speed = np.array([sc['launch_speed'] or 0.0 for sc in spacecraft_rows], dtype=float)
+        target_speed = np.array([target_speeds.get(sc['target_body'], np.nan) for sc in spacecraft_rows], dtype=float)
+        
+        # Per-target model constants (NaN where the target has no entry)
+        body_distance = np.array([BODY_DISTANCE_AU.get(sc['target_body'], np.nan) for sc in spacecraft_rows], dtype=float)
+        body_speed = np.array([BODY_ORBITAL_SPEED_KMS.get(sc['target_body'], np.nan) for sc in spacecraft_rows], dtype=float)
+        surface_speed = np.array([SURFACE_SPEED_KMS.get(sc['target_body'], np.nan) for sc in spacecraft_rows], dtype=float)
+        transit_years = np.array([TRANSIT_YEARS.get(sc['target_body'], np.nan) for sc in spacecraft_rows], dtype=float)
+        at_target_trajectory = np.array([
+            any(kind in sc['trajectory_type'] for kind in AT_TARGET_TRAJECTORIES.get(sc['target_body'], ()))
+            for sc in spacecraft_rows
+        ], dtype=bool)
+        drift_start, drift_rate = np.array(
+            [INACTIVE_DRIFT_AU.get(sc['target_body'], INACTIVE_DRIFT_DEFAULT_AU) for sc in spacecraft_rows], dtype=float
+        ).reshape(-1, 2).T
+        
+        # Time since launch in years
+        t = (now - launch) / np.timedelta64(1, 's') / YEAR_SECONDS
+        launch_year = launch.astype('datetime64[Y]').astype(int) + 1970
+        
+        inactive = np.array([sc['status'] == 'inactive' for sc in spacecraft_rows], dtype=bool)
+        has_arrived = arrival <= now  # False where there is no (valid) arrival time
+        is_orbiter = np.char.find(trajectory, 'orbiter') >= 0
+        is_surface = (np.char.find(trajectory, 'rover') >= 0) | (np.char.find(trajectory, 'lander') >= 0)
+        interstellar = target == 'Interstellar space'
+        sun = target == 'Sun'
+        kuiper = target == 'Kuiper Belt'
+        
+        # Parker Solar Probe: 88-day orbit between 0.046 and 0.73 AU
+        parker_phase = ((t % PARKER_PERIOD_YEARS) / PARKER_PERIOD_YEARS) * 2 * np.pi
+        
+        # np.select picks the first matching condition, like the scalar if/elif ladder
+        at_target = (has_arrived & np.isin(target, AT_TARGET_ON_ARRIVAL)) | at_target_trajectory
+        progress = np.where(at_target, 1.0, np.minimum(t / transit_years, 1.0))
+        distance_from_sun = np.select([
+            inactive,
+            interstellar,
+            ~np.isnan(transit_years),
+            sun,
+            kuiper,
+        ], [
+            drift_start + t * drift_rate,
+            40 + (t + (1977 - launch_year)) * 3.6,
+            1.0 + progress * (body_distance - 1.0),
+            PARKER_A_AU * (1 - 0.88 * np.cos(parker_phase)),
+            30 + t * 1,
+        ], default=1.0 + t * 0.3)
+        
+        # Vis-viva speeds are only selected where they are defined
+        with np.errstate(invalid='ignore'):
+            parker_speed = np.sqrt(MU_AU * (2/distance_from_sun - 1/PARKER_A_AU))
+            transfer_speed = np.sqrt(MU_AU * (2/distance_from_sun - 2/(1.0 + distance_from_sun)))
+        earth_speed = earth_position.speed_sun if earth_position else 30
+        
+        speed = np.select([
+            inactive & interstellar,
+            inactive,
+            sun & (name_en == 'Parker Solar Probe'),
+            interstellar & ((np.char.find(name_en, 'Voyager') >= 0) | (np.char.find(name_en, 'Pioneer') >= 0)),
+            kuiper & (name_en == 'New Horizons'),
+            is_orbiter & ~np.isnan(target_speed),
+            is_surface,
+            has_arrived,
+        ], [
+            np.where(launch_speed == 0, 16, launch_speed) * 0.95,
+            10 + t * 0.1,
+            parker_speed,
+            np.where(launch_speed == 0, 16.5, launch_speed) * 0.95,
+            14.5,
+            target_speed,
+            np.where(np.isnan(surface_speed), earth_speed, surface_speed),
+            np.where(np.isnan(body_speed), 30, body_speed),
+        ], default=transfer_speed)
+        
+        # Position and velocity (simplified, assuming radial trajectory)
+        angle = (t * 2 * np.pi) % (2 * np.pi)
+        cos_angle, sin_angle = np.cos(angle), np.sin(angle)
+        
+        return _body_state_array(
+            distance_from_sun * cos_angle,
+            distance_from_sun * sin_angle,
+            distance_from_sun * 0.05 * sin_angle,  # Slight inclination
+            -speed * sin_angle,
+            speed * cos_angle,
+            0.0,
+            distance_from_sun,
+            speed
+        )
     
     @staticmethod
     def calculate_relative_to_earth(body_position, earth_position):
-        """Calculate position and velocity relative to Earth"""
+        """
+        Calculate position and velocity relative to Earth
+        body_position, earth_position: BodyState (or anything with x, y, z, vx, vy, vz)
+        """
         # Distance relative to Earth
-        dx = body_position['x'] - earth_position['x']
-        dy = body_position['y'] - earth_position['y']
-        dz = body_position['z'] - earth_position['z']
+        dx = body_position.x - earth_position.x
+        dy = body_position.y - earth_position.y
+        dz = body_position.z - earth_position.z
         
-        distance_earth = math.sqrt(dx**2 + dy**2 + dz**2)  # in AU
+        distance_earth = math.hypot(dx, dy, dz)  # in AU
         
         # Velocity relative to Earth
-        dvx = body_position['vx'] - earth_position['vx']
-        dvy = body_position['vy'] - earth_position['vy']
-        dvz = body_position['vz'] - earth_position['vz']
+        dvx = body_position.vx - earth_position.vx
+        dvy = body_position.vy - earth_position.vy
+        dvz = body_position.vz - earth_position.vz
         
-        speed_earth = math.sqrt(dvx**2 + dvy**2 + dvz**2)  # in km/s
+        speed_earth = math.hypot(dvx, dvy, dvz)  # in km/s
         
         return {
             'distance_earth': distance_earth,
@@ -409,38 +838,61 @@ class OrbitalCalculator:
         }
     
     @staticmethod
+    def distances_to_earth(positions, earth_position):
+        """
+        Distances of many bodies from Earth at once
+        positions: (N, 3) array of x, y, z; earth_position: x, y, z of Earth
+        Also gives relative speeds when passed velocities instead of positions
+        Returns an array of N distances (in the units of the inputs)
+        """
+        return np.linalg.norm(np.asarray(positions) - np.asarray(earth_position), axis=1)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def format_distance(au):
         """Format distance from AU to km"""
         km = au * AU
         return f"{km:.2f} km"
     
     @staticmethod
-    def format_time_since_launch(launch_date_str):
-        """Calculate time since launch and return structured data"""
-        launch_date = datetime.strptime(launch_date_str, '%Y-%m-%d')
-        current_date = datetime.now()
+    def format_time_since_launch(launch_date_str, now=None):
+        """
+        Calculate time since launch and return structured data
+        years are whole calendar years since launch, days and hours count from the last anniversary
+        now: time to measure up to (datetime), the current time if None
+        """
+        launch_date = parse_ymd(launch_date_str)
+        current_date = now or _now()
+        
+        # Whole years: one less if this year's anniversary hasn't come yet
+        years = current_date.year - launch_date.year
+        if (current_date.month, current_date.day) < (launch_date.month, launch_date.day):
+            years -= 1
         
-        delta = current_date - launch_date
+        try:
+            anniversary = launch_date.replace(year=launch_date.year + years)
+        except ValueError:
+            # 29 February launch in a non-leap year: the anniversary falls on 1 March
+            anniversary = datetime(launch_date.year + years, 3, 1)
         
-        years = delta.days // 365
-        days = delta.days % 365
-        hours = delta.seconds // 3600
+        delta = current_date - anniversary
         
         return {
             'years': years,
-            'days': days,
-            'hours': hours
+            'days': delta.days,
+            'hours': delta.seconds // 3600
         }
     
     @staticmethod
     def calculate_distance_to_target(spacecraft_pos, target_pos):
         """
         Calculate distance from spacecraft to its target body
+        spacecraft_pos, target_pos: BodyState (or anything with x, y, z)
         Returns distance in AU
         """
-        dx = spacecraft_pos['x'] - target_pos['x']
-        dy = spacecraft_pos['y'] - target_pos['y']
-        dz = spacecraft_pos['z'] - target_pos['z']
+        dx = spacecraft_pos.x - target_pos.x
+        dy = spacecraft_pos.y - target_pos.y
+        dz = spacecraft_pos.z - target_pos.z
         
-        distance_au = math.sqrt(dx**2 + dy**2 + dz**2)
+        distance_au = math.hypot(dx, dy, dz)
         return distance_au
@@ -0,0 +1,107 @@
+import math
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from init_database import PLANETS_DATA, SPACECRAFT_DATA
+from orbital_calculations import BODY_STATE_DTYPE, BodyState, OrbitalCalculator
+
+ORBITAL_ELEMENT_KEYS = ('semi_major_axis', 'eccentricity', 'inclination', 'orbital_period',
+                        'mean_anomaly_0', 'perihelion_0', 'ascending_node_0')
+
+# Seed orbital elements by English name
+PLANET_ELEMENTS = {row[1]: dict(zip(ORBITAL_ELEMENT_KEYS, row[4:11])) for row in PLANETS_DATA}
+
+J2000 = datetime(2000, 1, 1, 12)
+
+# Heliocentric ecliptic longitudes at J2000.0 in degrees (JPL Horizons, rounded)
+J2000_LONGITUDES = {
+    'Earth': 100.4,
+    'Mars': 359.4,
+    'Jupiter': 36.3,
+    'Saturn': 45.7,
+}
+
+def longitude(x, y):
+    """Heliocentric ecliptic longitude in degrees"""
+    return math.degrees(math.atan2(y, x)) % 360
+
+def angle_difference(a, b):
+    """Smallest difference between two angles in degrees"""
+    return abs((a - b + 180) % 360 - 180)
+
+class PlanetPositionTest(unittest.TestCase):
+
+    def test_j2000_longitudes(self):
+        for name, expected in J2000_LONGITUDES.items():
+            with self.subTest(planet=name):
+                position = OrbitalCalculator.calculate_planet_position(PLANET_ELEMENTS[name], J2000)
+                self.assertLess(angle_difference(longitude(position.x, position.y), expected), 2.0)
+
+    def test_batch_matches_scalar(self):
+        elements = {key: np.array([el[key] for el in PLANET_ELEMENTS.values()]) for key in ORBITAL_ELEMENT_KEYS}
+        positions = OrbitalCalculator.calculate_planet_positions_batch(elements, J2000)
+        for name, position in zip(PLANET_ELEMENTS, positions):
+            with self.subTest(planet=name):
+                expected = OrbitalCalculator.calculate_planet_position(PLANET_ELEMENTS[name], J2000)
+                self.assertAlmostEqual(longitude(position['x'], position['y']),
+                                       longitude(expected.x, expected.y), places=6)
+
+    def test_aware_datetime_is_converted_to_utc(self):
+        aware = datetime(2000, 1, 1, 20, tzinfo=timezone(timedelta(hours=8)))
+        self.assertEqual(OrbitalCalculator.calculate_planet_position(PLANET_ELEMENTS['Jupiter'], aware),
+                         OrbitalCalculator.calculate_planet_position(PLANET_ELEMENTS['Jupiter'], J2000))
+
+# Seed spacecraft as the rows the app reads
+SPACECRAFT_ROWS = [
+    dict(zip(('name', 'name_en', 'wikipedia_url', 'wikipedia_url_en', 'launch_date', 'target_body', 'status',
+              'trajectory_type', 'launch_speed', 'current_phase', 'arrival_time'), row))
+    for row in SPACECRAFT_DATA
+]
+
+NOW = datetime(2025, 3, 14, 15, 9, 20)
+EARTH = BodyState(1.0, 0.0, 0.0, 0.0, 29.8, 0.0, 1.0, 29.8)
+
+def spacecraft_row(**fields):
+    """An active flyby launched at NOW with no arrival time, overridden by fields"""
+    row = dict(name_en='Probe', launch_date='2025-03-14', target_body='Mars', status='active',
+               trajectory_type='flyby', launch_speed=15.0, arrival_time=None)
+    row.update(fields)
+    return row
+
+class SpacecraftPositionTest(unittest.TestCase):
+
+    def position(self, row):
+        return OrbitalCalculator.calculate_spacecraft_position(row, None, EARTH, NOW)
+
+    def test_batch_matches_scalar(self):
+        positions = OrbitalCalculator.calculate_spacecraft_positions_batch(SPACECRAFT_ROWS, NOW, None, EARTH)
+        for row, position in zip(SPACECRAFT_ROWS, positions.tolist()):
+            with self.subTest(spacecraft=row['name_en']):
+                np.testing.assert_allclose(position, self.position(row), rtol=1e-12, atol=1e-12)
+
+    def test_jupiter_orbiter_at_jupiter_en_route(self):
+        position = self.position(spacecraft_row(target_body='Jupiter', trajectory_type='orbiter'))
+        self.assertEqual(position.distance_sun, 5.2)
+
+    def test_mars_flyby_ignores_arrival_time(self):
+        position = self.position(spacecraft_row(launch_date='2025-01-01', arrival_time='2025-02-01'))
+        self.assertLess(position.distance_sun, 1.5)
+        self.assertEqual(position.speed_sun, 24.1)
+
+    def test_saturn_rover_moves_with_earth(self):
+        position = self.position(spacecraft_row(target_body='Saturn', trajectory_type='rover'))
+        self.assertEqual(position.speed_sun, EARTH.speed_sun)
+
+    def test_time_since_launch_at_given_time(self):
+        age = OrbitalCalculator.format_time_since_launch('2024-03-14', NOW)
+        self.assertEqual(age, {'years': 1, 'days': 0, 'hours': 15})
+
+    def test_batch_without_spacecraft(self):
+        positions = OrbitalCalculator.calculate_spacecraft_positions_batch([], datetime(2025, 1, 1))
+        self.assertEqual(positions.dtype, BODY_STATE_DTYPE)
+        self.assertEqual(positions.shape, (0,))
+
+if __name__ == '__main__':
+    unittest.main()
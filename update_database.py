@@ -1,6 +1,57 @@
+import atexit
 import sqlite3
 from datetime import datetime
 
+# last_update is always written by SQLite as UTC, the same clock as the column's
+# default in init_database.py, so every row's timestamp is comparable
+UTC_NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%f', 'now')"
+
+SPACECRAFT_INSERT = f'''
+    INSERT INTO spacecraft 
+    (name, name_en, wikipedia_url, wikipedia_url_en, launch_date, 
+     target_body, status, trajectory_type, launch_speed, current_phase, 
+     arrival_time, last_update)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {UTC_NOW_SQL})
+'''
+
+SPACECRAFT_STATUS_UPDATE = f'''
+    UPDATE spacecraft 
+    SET status = ?, current_phase = ?, last_update = {UTC_NOW_SQL}
+    WHERE name = ?
+'''
+
+# Mark active spacecraft still en route whose arrival date (compared in SQLite) is on
+# or before the bound date as arrived; rows with an unparseable arrival date are left alone
+ARRIVED_UPDATE = f'''
+    UPDATE spacecraft
+    SET current_phase = 'Arrived', last_update = {UTC_NOW_SQL}
+    WHERE status = 'active'
+      AND current_phase = 'En route'
+      AND arrival_time IS NOT NULL
+      AND date(arrival_time) <= date(?)
+'''
+
+# Connection shared by every function in this script, opened on first use
+_CONN = None
+
+def _get_conn():
+    """Return the shared connection to solar_system.db, opening and tuning it on first use"""
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect('solar_system.db')
+        _CONN.row_factory = sqlite3.Row
+        _CONN.execute('PRAGMA journal_mode=WAL')
+        _CONN.execute('PRAGMA synchronous=NORMAL')  # WAL only syncs at checkpoints
+        _CONN.execute('PRAGMA temp_store=MEMORY')
+    return _CONN
+
+atexit.register(lambda: _CONN and _CONN.close())
+
+def print_spacecraft_list(cursor):
+    """Print every spacecraft in launch order, streaming rows from the cursor"""
+    for row in cursor.execute('SELECT name, name_en, status, current_phase, launch_date FROM spacecraft ORDER BY launch_date'):
+        print(f"{row['name']} ({row['name_en']}): {row['status']} | {row['current_phase']} | Launched: {row['launch_date']}")
+
 def update_spacecraft_status():
     """
     Update spacecraft status and information in the database.
@@ -11,7 +62,7 @@ def update_spacecraft_status():
     - Update last_update timestamp
     """
     
-    conn = sqlite3.connect('solar_system.db')
+    conn = _get_conn()
     cursor = conn.cursor()
     
     print("Updating spacecraft data...")
@@ -23,41 +74,26 @@ def update_spacecraft_status():
         # ('inactive', 'Mission completed', '伽利略号'),
     ]
     
+    # Apply all updates with one executemany in the same transaction
+    cursor.executemany(SPACECRAFT_STATUS_UPDATE, updates)
     for status, phase, name in updates:
-        cursor.execute('''
-            UPDATE spacecraft 
-            SET status = ?, current_phase = ?, last_update = ?
-            WHERE name = ?
-        ''', (status, phase, datetime.now().isoformat(), name))
         print(f"Updated {name}: {status} - {phase}")
     
     # Example: Add new spacecraft (modify as needed)
     # new_spacecraft = [
     #     ('新探测器', 'New Probe', 'https://zh.wikipedia.org/wiki/example', 
     #      'https://en.wikipedia.org/wiki/example', '2025-01-01', 'Mars', 
-    #      'active', 'flyby', 15.0, 'En route', '2026-06-01', 
-    #      datetime.now().isoformat())
+    #      'active', 'flyby', 15.0, 'En route', '2026-06-01')
     # ]
     
-    # cursor.executemany('''
-    #     INSERT INTO spacecraft 
-    #     (name, name_en, wikipedia_url, wikipedia_url_en, launch_date, 
-    #      target_body, status, trajectory_type, launch_speed, current_phase, 
-    #      arrival_time, last_update)
-    #     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    # ''', new_spacecraft)
+    # cursor.executemany(SPACECRAFT_INSERT, new_spacecraft)
     
     # Display current spacecraft status
     print("\nCurrent Spacecraft Status:")
     print("-" * 100)
-    cursor.execute('SELECT name, name_en, status, current_phase, launch_date FROM spacecraft ORDER BY launch_date')
-    spacecraft = cursor.fetchall()
-    
-    for sc in spacecraft:
-        print(f"{sc[0]} ({sc[1]}): {sc[2]} | {sc[3]} | Launched: {sc[4]}")
+    print_spacecraft_list(cursor)
     
     conn.commit()
-    conn.close()
     
     print("\nDatabase update completed!")
 
@@ -67,47 +103,40 @@ def update_mission_phases():
     This function can be extended to automatically update phases
     based on arrival times and current dates.
     """
-    conn = sqlite3.connect('solar_system.db')
+    conn = _get_conn()
     cursor = conn.cursor()
     
     current_date = datetime.now()
     
     print("Checking mission phases...")
     
-    # Get spacecraft with arrival times
-    cursor.execute('''
-        SELECT id, name, arrival_time, current_phase, status
-        FROM spacecraft
-        WHERE arrival_time IS NOT NULL AND status = 'active'
-    ''')
-    
-    spacecraft = cursor.fetchall()
-    
-    for sc in spacecraft:
-        sc_id, name, arrival_str, current_phase, status = sc
-        if arrival_str:
-            try:
-                arrival_date = datetime.strptime(arrival_str, '%Y-%m-%d')
-                
-                if current_date >= arrival_date:
-                    # Spacecraft has arrived
-                    if current_phase == 'En route':
-                        new_phase = 'Arrived'
-                        cursor.execute('''
-                            UPDATE spacecraft
-                            SET current_phase = ?, last_update = ?
-                            WHERE id = ?
-                        ''', (new_phase, current_date.isoformat(), sc_id))
-                        print(f"Updated {name}: {new_phase}")
-                
-            except ValueError as e:
-                print(f"Error parsing arrival date for {name}: {e}")
-    
-    conn.commit()
-    conn.close()
+    # Mark every active spacecraft whose arrival date has passed as arrived in one
+    # UPDATE; the transaction commits on success and rolls back if it raises
+    with conn:
+        cursor.execute(ARRIVED_UPDATE, (current_date.isoformat(),))
+    print(f"{cursor.rowcount} spacecraft updated")
     
     print("Mission phase update completed!")
 
+def add_new_spacecraft_bulk(rows):
+    """
+    Add many spacecraft to the database in one transaction.
+    
+    Parameters:
+    - rows: sequence of (name, name_en, wikipedia_url, wikipedia_url_en,
+      launch_date, target_body, status, trajectory_type, launch_speed,
+      current_phase, arrival_time) tuples, as for add_new_spacecraft
+    """
+    
+    conn = _get_conn()
+    
+    # One transaction (and commit) for all rows
+    with conn:
+        conn.executemany(SPACECRAFT_INSERT, rows)
+    
+    for row in rows:
+        print(f"Successfully added spacecraft: {row[0]} ({row[1]})")
+
 def add_new_spacecraft(name, name_en, wikipedia_url, wikipedia_url_en, 
                        launch_date, target_body, status, trajectory_type,
                        launch_speed, current_phase, arrival_time=None):
@@ -128,23 +157,9 @@ def add_new_spacecraft(name, name_en, wikipedia_url, wikipedia_url_en,
     - arrival_time: Arrival time in YYYY-MM-DD format (optional)
     """
     
-    conn = sqlite3.connect('solar_system.db')
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        INSERT INTO spacecraft 
-        (name, name_en, wikipedia_url, wikipedia_url_en, launch_date, 
-         target_body, status, trajectory_type, launch_speed, current_phase, 
-         arrival_time, last_update)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (name, name_en, wikipedia_url, wikipedia_url_en, launch_date, 
-          target_body, status, trajectory_type, launch_speed, current_phase, 
-          arrival_time, datetime.now().isoformat()))
-    
-    conn.commit()
-    conn.close()
-    
-    print(f"Successfully added spacecraft: {name} ({name_en})")
+    add_new_spacecraft_bulk([(name, name_en, wikipedia_url, wikipedia_url_en, launch_date, 
+                              target_body, status, trajectory_type, launch_speed, current_phase, 
+                              arrival_time)])
 
 if __name__ == '__main__':
     print("Solar System Database Update Tool")
@@ -163,16 +178,8 @@ if __name__ == '__main__':
     elif choice == '2':
         update_mission_phases()
     elif choice == '3':
-        conn = sqlite3.connect('solar_system.db')
-        cursor = conn.cursor()
-        cursor.execute('SELECT name, name_en, status, current_phase, launch_date FROM spacecraft ORDER BY launch_date')
-        spacecraft = cursor.fetchall()
-        
         print("\nCurrent Spacecraft List:")
         print("-" * 100)
-        for sc in spacecraft:
-            print(f"{sc[0]} ({sc[1]}): {sc[2]} | {sc[3]} | Launched: {sc[4]}")
-        
-        conn.close()
+        print_spacecraft_list(_get_conn().cursor())
     else:
         print("Invalid choice. Exiting.")